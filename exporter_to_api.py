@@ -1,11 +1,23 @@
 import bpy
 from bpy.props import PointerProperty
 from bpy.types import Context, UILayout, AnyType, PointerProperty
-import requests
+import importlib
 import datetime
 import json
 import time
 import os
+import array
+import collections
+import contextlib
+import hashlib
+import mmap
+import queue
+import select
+import socket
+import tempfile
+import threading
+import uuid
+import zlib
 
 """
 Export to RESTfull API add-on for Blender. You can use this add-on to make faster the process of sending 
@@ -28,16 +40,54 @@ bl_info = {
     "category": "Import-Export"
 }
 
+
+class LazyModule:
+    """
+        LazyModule class imports the module on the first access to its attribute. Networking and export modules
+        (requests with urllib3, idna, charset detection, etc.) are imported only when an operator uses them, so they
+        don't slow down Blender startup
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+
+# modules imported on the first use
+requests = LazyModule("requests")
+http_client = LazyModule("http.client")
+urllib_parse = LazyModule("urllib.parse")
+subprocess = LazyModule("subprocess")
+concurrent_futures = LazyModule("concurrent.futures")
+urllib3_exceptions = LazyModule("urllib3.exceptions")
+
 # HTTP requests timeout
 TIMEOUT = 100
 
+# size of chunks used when reading files
+CHUNK_SIZE = 1024 * 1024
+
+# supported textures file extensions
+TEXTURE_EXTENSIONS = (".png", ".jpg")
+
+# texture preprocessing settings, part of the key of preprocessed textures cache
+TEXTURE_SETTINGS = ()
+
 # messages definitions
 HTTP_ERROR_MESSAGE = "Http Error: "
 CONNECTION_ERROR_MESSAGE = "Connection Error: "
 TIMEOUT_ERROR_MESSAGE = "Timeout Error: "
 UNKNOWN_ERROR_MESSAGE = "Oops... Unknown Error: "
+INVALID_RESPONSE_MESSAGE = "Invalid Response Error: "
 INVALID_HOST_MESSAGE = "Error: host has to start with https:// or http://"
 FILENAME_EMPTY_MESSAGE = "Error: file name is empty"
+SERVER_UNAVAILABLE_MESSAGE = "Error: server is not available, check the connection"
+FILE_ERROR_MESSAGE = "File Error: "
 
 # panel UI
 CREDENTIALS_SECTION_NAME = "Credentials:"
@@ -115,6 +165,14 @@ class ClearLogList(bpy.types.Operator):
         return {'FINISHED'}
 
 
+def add_log(message):
+    """
+        Function adds log to Log section, can be passed as callback to helpers which log their progress
+    """
+
+    bpy.ops.log.add(log=message)
+
+
 # ----------------- End: Log section ----------------- #
 
 
@@ -218,6 +276,8 @@ class APIData(bpy.types.PropertyGroup):
 
         host : string
             hostname of the server
+        replicas : string
+            comma separated hostnames of the server replicas, requests are routed to the fastest healthy one
         user : User
             User object
     """
@@ -227,12 +287,330 @@ class APIData(bpy.types.PropertyGroup):
         description="Host address",
         default=""
     )
+    replicas: bpy.props.StringProperty(
+        name="Replicas",
+        description="Comma separated addresses of host replicas",
+        default=""
+    )
     user: bpy.props.PointerProperty(type=User)
 
 
 # ----------------- End: Helpers ----------------- #
 
 
+# ----------------- Start: Endpoints routing ----------------- #
+
+"""
+    Classes and functions to route requests between the host and its replicas. Background health checks send the same
+    GET request as CheckConnection to every endpoint and track moving averages of their latency and error rate.
+    Each request is sent to the fastest healthy endpoint and fails over to the next one on connection errors.
+    The state of endpoints is also used as a cached connection check, so Export doesn't need a request to find out
+    the server is down. All requests share one session, which keeps the connection alive for the next request.
+"""
+
+# seconds between background health checks
+HEALTH_CHECK_INTERVAL = 30
+
+# health check request timeout
+HEALTH_CHECK_TIMEOUT = 5
+
+# seconds for which the result of the last request to the endpoint is trusted as its connection state
+CONNECTION_STATE_TTL = 60
+
+
+class EndpointStats:
+    """
+        EndpointStats class stores the state of one endpoint
+
+        host : string
+            hostname of the endpoint
+        latency : float
+            moving average of the endpoint latency in seconds, None if it has not been measured yet
+        error_rate : float
+            moving average of failed requests, 0 - 1
+        available : bool
+            False if the last request to the endpoint has failed
+        requests : int
+            count of requests sent to the endpoint
+        checked : float
+            time.monotonic() of the last request result, None if there was no request yet
+        throughput : float
+            moving average of the upload throughput in bytes per second, None if there was no upload yet
+    """
+
+    # weight of the last request in moving averages
+    SMOOTHING = 0.3
+
+    # error rate from which the endpoint is unhealthy
+    MAX_ERROR_RATE = 0.5
+
+    def __init__(self, host):
+        self.host = host
+        self.latency = None
+        self.error_rate = 0.0
+        self.available = True
+        self.requests = 0
+        self.checked = None
+        self.throughput = None
+
+    @property
+    def healthy(self):
+        return self.available and self.error_rate < self.MAX_ERROR_RATE
+
+    @property
+    def fresh(self):
+        return self.checked is not None and time.monotonic() - self.checked < CONNECTION_STATE_TTL
+
+    def record(self, latency=None, failed=False):
+        """
+            Function updates the endpoint state with the result of one request. Latency of uploads is not recorded,
+            because it depends on the size of the upload
+        """
+
+        self.requests += 1
+        self.available = not failed
+        self.checked = time.monotonic()
+        self.error_rate += self.SMOOTHING * (float(failed) - self.error_rate)
+
+        if latency is not None:
+            self.latency = latency if self.latency is None else self.latency + self.SMOOTHING * (latency - self.latency)
+
+    def record_throughput(self, size, seconds):
+        """
+            Function updates the upload throughput with the size of the files sent in the given time
+        """
+
+        if size == 0 or seconds <= 0:
+            return
+
+        throughput = size / seconds
+        self.throughput = throughput if self.throughput is None \
+            else self.throughput + self.SMOOTHING * (throughput - self.throughput)
+
+    def upload_time(self, size, assumed_throughput):
+        """
+            Function estimates the time of the upload of the given size, assumed throughput is used if there was no
+            upload to the endpoint yet
+        """
+
+        return (self.latency or 0.0) + size / (self.throughput or assumed_throughput)
+
+    def __str__(self):
+        latency = "-" if self.latency is None else f"{self.latency * 1000:.0f} ms"
+        throughput = "-" if self.throughput is None else f"{self.throughput / 1024 / 1024:.1f} MB/s"
+        state = "healthy" if self.healthy else "down"
+        return f"{self.host}: {state}, latency {latency}, throughput {throughput}, errors {self.error_rate:.0%}, " \
+               f"requests {self.requests}"
+
+
+# host -> EndpointStats, shared by operators and the health monitor
+_endpoints = {}
+_endpoints_lock = threading.Lock()
+
+# HTTP session shared by all requests
+_session = None
+
+
+def get_session():
+    """
+        Function returns the shared HTTP session. Its connection pool keeps connections to endpoints alive between
+        requests, health checks keep them warm for the next request
+    """
+
+    global _session
+
+    if _session is None:
+        _session = requests.Session()
+
+    return _session
+
+
+def close_session():
+    global _session
+
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+def api_hosts(api_data):
+    """
+        Function returns the list of the host and its replicas from APIData scene property
+    """
+
+    replicas = [replica.strip() for replica in api_data.replicas.split(",") if replica.strip() != ""]
+    return [api_data.host] + [replica for replica in replicas if replica != api_data.host]
+
+
+def endpoint_stats(host):
+    with _endpoints_lock:
+        if host not in _endpoints:
+            _endpoints[host] = EndpointStats(host)
+        return _endpoints[host]
+
+
+def rank_endpoints(hosts):
+    """
+        Function orders hosts from the fastest healthy to the unhealthy ones. Hosts without measured latency go after
+        the measured healthy ones
+    """
+
+    def rank(host):
+        stats = endpoint_stats(host)
+        return not stats.healthy, float("inf") if stats.latency is None else stats.latency
+
+    return sorted(hosts, key=rank)
+
+
+def connect_failed(error):
+    """
+        Function returns True if the request has failed while connecting to the endpoint, so the endpoint can't have
+        received any of it
+    """
+
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+
+    reason = error.args[0] if error.args else None
+    reason = getattr(reason, "reason", reason)
+    return isinstance(reason, urllib3_exceptions.NewConnectionError)
+
+
+def route_request(hosts, send, log, measure=True, idempotent=True):
+    """
+        Function sends the request to the fastest healthy endpoint and fails over to the next one when the endpoint
+        can't be reached or answers with server error. The error or response of the last endpoint is returned
+
+        send : callable
+            Function sending the request to the host given as argument and returning the response
+        log : callable
+            Function logging the routing decisions
+        measure : bool
+            True - if the request duration is recorded as the endpoint latency
+        idempotent : bool
+            False - if the request can't be repeated (POST), it fails over only when the endpoint couldn't be
+            connected, after timeouts and server errors the endpoint may have already processed it
+    """
+
+    ranked = rank_endpoints(hosts)
+
+    for attempt, host in enumerate(ranked, 1):
+        last = attempt == len(ranked)
+        log(f"Routing to {host}" if attempt == 1 else f"Failover to {host}")
+
+        start = time.perf_counter()
+        try:
+            response = send(host)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+            endpoint_stats(host).record(failed=True)
+            health_monitor.refresh()
+            if last or not (idempotent or connect_failed(error)):
+                raise
+            continue
+
+        failed = response.status_code >= 500
+        endpoint_stats(host).record(time.perf_counter() - start if measure and not failed else None, failed)
+        if failed:
+            health_monitor.refresh()
+        if not failed or last or not idempotent:
+            return response
+
+
+def connection_state(hosts):
+    """
+        Function returns the cached connection state of the host and its replicas, without sending any request.
+        Stale state is refreshed by the health monitor in the background
+
+        returns : bool
+            True - if any endpoint is known to be up, False - if all of them are known to be down, None - if the state
+            is not known
+    """
+
+    states = [endpoint_stats(host) for host in hosts]
+
+    if any(stats.fresh and stats.available for stats in states):
+        return True
+
+    if not all(stats.fresh for stats in states):
+        health_monitor.refresh()
+        return None
+
+    return False
+
+
+def check_endpoints(hosts, path, headers):
+    """
+        Function sends health check GET request to every endpoint and records the results. Healthy endpoints uploaded
+        to over plain HTTP are checked over the upload connection too, so it's kept alive for the next upload
+    """
+
+    for host in hosts:
+        start = time.perf_counter()
+        try:
+            response = get_session().get(host + path, headers=headers, timeout=HEALTH_CHECK_TIMEOUT)
+            failed = response.status_code >= 500
+        except requests.exceptions.RequestException:
+            failed = True
+        endpoint_stats(host).record(None if failed else time.perf_counter() - start, failed)
+
+        if not failed and zero_copy_supported(host):
+            refresh_upload_connection(host + path, headers)
+
+
+class HealthMonitor:
+    """
+        HealthMonitor class runs health checks of endpoints in the background thread. Endpoints are configured by
+        operators from scene properties, because the background thread can't access Blender data. Checks run every
+        HEALTH_CHECK_INTERVAL seconds or immediately after refresh() is called
+    """
+
+    def __init__(self):
+        self.thread = None
+        self.stopped = threading.Event()
+        self.wakeup = threading.Event()
+        self.endpoints = ([], "", {})
+
+    def configure(self, hosts, path, headers):
+        self.endpoints = (list(hosts), path, dict(headers))
+
+        if self.thread is None:
+            self.stopped = threading.Event()
+            self.thread = threading.Thread(target=self._run, args=(self.stopped,), daemon=True)
+            self.thread.start()
+            self.refresh()
+
+    def _run(self, stopped):
+        while not stopped.is_set():
+            self.wakeup.wait(HEALTH_CHECK_INTERVAL)
+            self.wakeup.clear()
+
+            if not stopped.is_set():
+                check_endpoints(*self.endpoints)
+
+    def refresh(self):
+        self.wakeup.set()
+
+    def stop(self):
+        self.stopped.set()
+        self.wakeup.set()
+        self.thread = None
+
+
+health_monitor = HealthMonitor()
+
+
+def monitor_endpoints(context):
+    """
+        Function starts or updates background health checks of the scene host and its replicas
+    """
+
+    headers = {'Authorization': "Bearer " + context.scene.APIData.user.authorization}
+    health_monitor.configure(api_hosts(context.scene.APIData), context.scene.Request.endpoint, headers)
+
+
+# ----------------- End: Endpoints routing ----------------- #
+
+
 # ----------------- Start: API communication helpers ----------------- #
 
 """
@@ -258,14 +636,19 @@ class DoGetRequest(bpy.types.Operator):
         print(f"Executing: {bpy.context.scene.Request.method}request")
 
         # setting up
-        endpoint = context.scene.APIData.host + context.scene.Request.endpoint
+        hosts = api_hosts(context.scene.APIData)
+        path = context.scene.Request.endpoint
         headers = json.loads(bpy.context.scene.Request.headers)
         scene_response = context.scene.Response
         scene_response.successful = False
 
+        # sending the request to the endpoint chosen by routing
+        def send(host):
+            return get_session().get(host + path, headers=headers, timeout=TIMEOUT)
+
         # executing GET request and handling possible errors
         try:
-            response = requests.get(endpoint, headers=headers, timeout=TIMEOUT)
+            response = route_request(hosts, send, add_log)
             scene_response.successful = True
         except requests.exceptions.HTTPError as httperr:
             print(HTTP_ERROR_MESSAGE, httperr)
@@ -314,15 +697,20 @@ class DoPostRequest(bpy.types.Operator):
         print(f"Executing: {bpy.context.scene.Request.method}request")
 
         # setting up
-        endpoint = context.scene.APIData.host + context.scene.Request.endpoint
+        hosts = api_hosts(context.scene.APIData)
+        path = context.scene.Request.endpoint
         headers = json.loads(bpy.context.scene.Request.headers)
         payload = json.loads(bpy.context.scene.Request.payload.body)
         scene_response = context.scene.Response
         scene_response.successful = False
 
+        # sending the request to the endpoint chosen by routing
+        def send(host):
+            return get_session().post(host + path, headers=headers, data=payload, timeout=TIMEOUT)
+
         # executing POST request and handling possible errors
         try:
-            response = requests.post(endpoint, headers=headers, data=payload, timeout=TIMEOUT)
+            response = route_request(hosts, send, add_log, idempotent=False)
             scene_response.successful = True
         except requests.exceptions.HTTPError as httperr:
             print(HTTP_ERROR_MESSAGE, httperr)
@@ -371,15 +759,20 @@ class DoPutRequest(bpy.types.Operator):
         print(f"Executing: {bpy.context.scene.Request.method}request")
 
         # setting up
-        endpoint = context.scene.APIData.host + context.scene.Request.endpoint
+        hosts = api_hosts(context.scene.APIData)
+        path = context.scene.Request.endpoint
         headers = json.loads(bpy.context.scene.Request.headers)
         payload = json.loads(bpy.context.scene.Request.payload.body)
         scene_response = context.scene.Response
         scene_response.successful = False
 
+        # sending the request to the endpoint chosen by routing
+        def send(host):
+            return get_session().put(host + path, headers=headers, data=payload, timeout=TIMEOUT)
+
         # executing PUT request and handling possible errors
         try:
-            response = requests.put(endpoint, headers=headers, data=payload, timeout=TIMEOUT)
+            response = route_request(hosts, send, add_log)
             scene_response.successful = True
         except requests.exceptions.HTTPError as httperr:
             print(HTTP_ERROR_MESSAGE, httperr)
@@ -427,14 +820,19 @@ class DoDeleteRequest(bpy.types.Operator):
         print(f"Executing: {bpy.context.scene.Request.method}request")
 
         # setting up
-        endpoint = context.scene.APIData.host + context.scene.Request.endpoint
+        hosts = api_hosts(context.scene.APIData)
+        path = context.scene.Request.endpoint
         headers = json.loads(bpy.context.scene.Request.headers)
         scene_response = context.scene.Response
         scene_response.successful = False
 
+        # sending the request to the endpoint chosen by routing
+        def send(host):
+            return get_session().delete(host + path, headers=headers, timeout=TIMEOUT)
+
         # executing DELETE request and handling possible errors
         try:
-            response = requests.delete(endpoint, headers=headers, timeout=TIMEOUT)
+            response = route_request(hosts, send, add_log)
             scene_response.successful = True
         except requests.exceptions.HTTPError as httperr:
             print(HTTP_ERROR_MESSAGE, httperr)
@@ -502,11 +900,14 @@ class DoRequest(bpy.types.Operator):
             bpy.ops.log.add(log=f"Error: Request method is invalid: {method}")
             return {'FINISHED'}
 
-        # checking if the hostname is correct
-        if not context.scene.APIData.host.startswith("https://") \
-                and not context.scene.APIData.host.startswith("http://"):
-            bpy.ops.log.add(log=INVALID_HOST_MESSAGE)
-            return {'FINISHED'}
+        # checking if the hostnames of the host and its replicas are correct
+        for host in api_hosts(context.scene.APIData):
+            if not host.startswith("https://") and not host.startswith("http://"):
+                bpy.ops.log.add(log=INVALID_HOST_MESSAGE)
+                return {'FINISHED'}
+
+        # keeping the health of the host and its replicas checked in the background
+        monitor_endpoints(context)
 
         # creating the operator call string as f.e. "bpy.ops.system.do_get_request"
         method_call = "bpy.ops.system.do_" + method.lower() + "_request()"
@@ -543,283 +944,1951 @@ class CheckConnection(bpy.types.Operator):
 
     def execute(self, context):
         """
-            Function just calls a GET request with an empty body and headers
+            Function just calls a GET request with an empty body and headers, then checks the host replicas and
+            logs the state of every endpoint
         """
 
+        register_operators()
+
         request = context.scene.Request
         request.method = "GET"
         request.headers = ""
         request.payload.body = ""
 
+        # endpoint is emptied by the request
+        path = request.endpoint
+        headers = {'Authorization': "Bearer " + context.scene.APIData.user.authorization}
+
         # calling the request
         bpy.ops.system.do_request()
 
+        # checking the replicas too and logging the state of all endpoints
+        hosts = api_hosts(context.scene.APIData)
+        if len(hosts) > 1:
+            check_endpoints(hosts, path, headers)
+
+        for host in rank_endpoints(hosts):
+            bpy.ops.log.add(log=str(endpoint_stats(host)))
+
         return {'FINISHED'}
 
 
 # ----------------- End: API communication helpers ----------------- #
 
 
-# ----------------- Start: Export (VMCK requirements) ----------------- #
+# ----------------- Start: Upload transport ----------------- #
 
 """
-    Implementing the Export of the 3D model in different file formats with textures to VMCK server.
-    To do Export you should have save the project and and store your textures in "textures" folder in the project 
-    root. Supported textures are in png and jpg format. All textures has to be in that folder in the same dir level. No
-    deeper levels are allowed.
-    
-    Currently it's not possible to communicate with the server, so the response is hardcoded to show the response 
-    logging process
+    Upload transport sending the multipart body straight from the exported files to the socket. Over plain HTTP file
+    parts are sent with sendfile without being copied to Python. When checksums are needed, files are memory mapped
+    and every chunk is hashed and sent from the same memory, so the data is read only once. HTTPS uses requests with
+    the streamed multipart body, which computes the checksums in the same pass too.
 """
 
 
-class Export(bpy.types.Operator):
+class TransportResponse:
     """
-        Export class exports 3D models in different formats with their textures to the VMCK server
+        TransportResponse class wraps http.client response into the interface of requests response used by the add-on
+
+        status_code : int
+            HTTP response code
+        headers : dict
+            Response headers
+        content : bytes
+            Response body
     """
 
-    bl_idname = "system.export"
-    bl_label = "Export"
+    def __init__(self, response):
+        self.status_code = response.status
+        self.headers = dict(response.getheaders())
+        self.content = response.read()
 
-    # invokes the dialog with the user to choose the file format
-    def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self, width=300)
+    def __bool__(self):
+        return self.status_code < 400
 
-    # file format dialog
-    def draw(self, context):
-        layout = self.layout
-        layout.prop(context.scene, "file_format")
+    def json(self):
+        return json.loads(self.content)
 
-    def execute(self, context):
 
-        # checking the file name
-        if bpy.context.scene.filename is "":
-            bpy.ops.log.add(log=FILENAME_EMPTY_MESSAGE)
-            return {'FINISHED'}
+class Checksums(dict):
+    """
+        Checksums class maps filenames to sha256 of the sent files. Transports fill it in while the files are sent,
+        it also sums the time spent hashing, so the overhead of checksums can be compared with the transfer time
 
-        # ------------------------------------------ #
-        """
-            Uncomment when the server will be up
-        """
+        seconds : float
+            Time spent hashing
+    """
 
-        # # checking the connection with the server
-        # bpy.ops.system.check_connection()
-        #
-        # # if it's not possible to connect stops export
-        # if not bpy.context.scene.Response.successful:
-        #     return {'FINISHED'}
-        # else:
-        #     bpy.ops.log.clear()
+    def __init__(self):
+        super().__init__()
+        self.seconds = 0.0
 
-        # ------------------------------------------ #
+    def sha256(self):
+        return ChecksumDigest(self)
 
-        # getting the project dir path
-        dir = bpy.path.abspath("//")
+    def manifest(self, boundary):
+        """
+            Function returns the manifest form field with checksums of the sent files, it's sent after the files,
+            because checksums are known only when the files are sent
+        """
 
-        # preparing the 3D model file info
-        file_format = context.scene.file_format + ".glb" \
-            if context.scene.file_format == "GLTF" else context.scene.file_format
+        return multipart_header(boundary, 'manifest') + f'{json.dumps(self)}\r\n'.encode()
 
-        # filename from the filename field
-        filename = context.scene.filename
 
-        # creating the filepath to save file to export
-        filepath = bpy.path.abspath("//" + filename + "." + file_format.lower())
+class ChecksumDigest:
+    """
+        ChecksumDigest class is sha256 which adds the time spent hashing to its Checksums
+    """
 
-        # filling textures array with textures files names from textures folder in the project root
-        textures = \
-            [f for f in os.listdir(bpy.path.abspath("//" + "textures")) if f.endswith(".png") or f.endswith(".jpg")] \
-                if os.path.exists(bpy.path.abspath("//" + "textures")) else []
+    def __init__(self, checksums):
+        self.checksums = checksums
+        self.digest = hashlib.sha256()
 
-        # saving the file to export using Blender Operators
-        if file_format == 'OBJ':
-            bpy.ops.export_scene.obj(filepath=filepath)
-        elif file_format == 'FBX':
-            bpy.ops.export_scene.fbx(filepath=filepath)
-        elif file_format == 'BLEND':
-            bpy.ops.wm.save_mainfile(filepath=filepath)
-        elif file_format == 'GLTF':
-            bpy.ops.export_scene.gltf(filepath=filepath)
+    def update(self, data):
+        start = time.perf_counter()
+        self.digest.update(data)
+        self.checksums.seconds += time.perf_counter() - start
 
-        bpy.ops.log.add(log="Tmp file saved to: " + dir)
-        bpy.ops.log.add(log="Exporting..." + filename)
+    def hexdigest(self):
+        return self.digest.hexdigest()
 
-        # setting up request variables
-        endpoint = context.scene.APIData.host + context.scene.Request.endpoint
-        headers = {'Authorization': "Bearer " + context.scene.APIData.user.authorization}
 
-        # model to export
-        files = {
-            'name': filename,
-            'model': (filename, open(filepath, 'rb'), 'multipart/form-data')
-        }
+def multipart_header(boundary, name, filename=None, content_type=None):
+    """
+        Function returns the header of one part of multipart/form-data body, without filename for form fields
+    """
 
-        if file_format == 'OBJ':
-            mtl_file_obj_filepath = dir + filename + ".mtl"
-            files.update({'assets': (filename + ".mtl", open(mtl_file_obj_filepath), 'multipart/form-data')})
+    if filename is None:
+        return f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
 
-        # filling files dictionary with model textures if there is any
-        if textures is not []:
-            for key, texture in enumerate(textures):
-                files.update({f'textures[{key}]': (texture,
-                                                   open(bpy.path.abspath("//" + "textures/" + texture), 'rb'),
-                                                   'multipart/form-data'
-                                                   )
-                              })
+    return (f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n').encode()
 
-        context.scene.Response.successful = False
-        response = None
 
-        # sending POST request
-        try:
-            response = requests.post(endpoint, headers=headers, files=files, timeout=TIMEOUT)
-            context.scene.Response.successful = True
-        except requests.exceptions.HTTPError as httperr:
-            print(HTTP_ERROR_MESSAGE, httperr)
-            bpy.ops.log.add(log=HTTP_ERROR_MESSAGE + str(httperr))
-        except requests.exceptions.ConnectionError as conerr:
-            print(CONNECTION_ERROR_MESSAGE, conerr)
-            bpy.ops.log.add(log=CONNECTION_ERROR_MESSAGE + str(conerr))
-        except requests.exceptions.Timeout as tmterr:
-            print(TIMEOUT_ERROR_MESSAGE, tmterr)
-            bpy.ops.log.add(log=TIMEOUT_ERROR_MESSAGE + str(tmterr))
-        except requests.exceptions.RequestException as error:
-            print(UNKNOWN_ERROR_MESSAGE, error)
-            bpy.ops.log.add(log=UNKNOWN_ERROR_MESSAGE + str(error))
+# idle keep-alive connections of uploads over plain HTTP, (hostname, port) -> connection
+_upload_connections = {}
 
-        response_content = {}
-        if response:
-            bpy.ops.log.add(log="Status: " + f"[{str(response.status_code)}]")
-            response_content = dict(response.content)
-
-        # -------- Hard coded response ------------------------- #
-
-        response_content = {
-            "id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
-            "structureId": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
-            "name": "Věž Kropáčka",
-            "transformation": [
-                [1, 2, 3],
-                [4, 5, 6],
-                [7, 8, 9]
-            ],
-            "createdDate": "2020-12-11T17:39:25.826Z",
-            "model": {
-                "id": "507f1f77bcf86cd799439011",
-                "filename": filename + "." + file_format.lower(),
-                "uploadDate": "2019-10-13T15:31:48.507Z",
-                "href": "/models/507f1f77bcf86cd799439011"
-            },
-            "textures": [
-                {
-                    "id": "507f191e810c19729de860ea",
-                    "filename": "vez_kropacka_stena.jpg",
-                    "uploadDate": "2019-10-13T15:49:46.583Z",
-                    "href": "/textures/507f191e810c19729de860ea"
-                }
-            ],
-            "properties": [
-                {
-                    "weather": "rain20"
-                }
-            ],
-            "status": "preparing",
-            "assets": [
-                {
-                    "id": "54759eb3c090d83494e2d804",
-                    "filename": "vez_kropacka.sfa",
-                    "uploadDate": "2019-10-13T15:52:16.704Z",
-                    "href": "/assets/54759eb3c090d83494e2d804"
-                }
-            ],
-            "version": "1.15.3",
-            "href": "/3DObjects/3fa85f64/0.15.3"
-        }
+_upload_connections_lock = threading.Lock()
 
-        # --------------------------------------------------- #
 
-        # logging the response to Log
-        bpy.ops.log.add(log="Status: " + "[201]")
+def get_upload_connection(hostname, port):
+    """
+        Function returns the idle connection to the endpoint kept alive by the previous upload, or the new one,
+        connections closed by the server meanwhile are dropped
 
-        # info about saved model
-        bpy.ops.log.add(log="< ---- Model ---- >")
-        bpy.ops.log.add(log="ID: " + response_content['model']['id'])
-        bpy.ops.log.add(log="Filename: " + response_content['model']['filename'])
-        bpy.ops.log.add(log="Upload date: " + response_content['model']['uploadDate'])
-        bpy.ops.log.add(log="Href: " + response_content['model']['href'])
+        returns : tuple
+            connection and True if it's already connected
+    """
 
-        # info about model textures
-        bpy.ops.log.add(log="< ---- Textures ---- >")
-        for texture in response_content['textures']:
-            bpy.ops.log.add(log="ID: " + texture['id'])
-            bpy.ops.log.add(log="Filename: " + texture['filename'])
-            bpy.ops.log.add(log="Upload date: " + texture['uploadDate'])
-            bpy.ops.log.add(log="Href: " + texture['href'])
-            bpy.ops.log.add(log="------------------------")
+    with _upload_connections_lock:
+        connection = _upload_connections.pop((hostname, port), None)
 
-        bpy.ops.log.add(log="Done!")
+    if connection is not None:
+        # idle connection is readable only when the server has closed it
+        if connection.sock is not None and not select.select([connection.sock], [], [], 0)[0]:
+            return connection, True
+        connection.close()
 
-        return {'FINISHED'}
+    return http_client.HTTPConnection(hostname, port, timeout=TIMEOUT), False
 
 
-# ----------------- Start: Export (VMCK requirements) ----------------- #
+def release_upload_connection(hostname, port, connection):
+    with _upload_connections_lock:
+        idle = _upload_connections.pop((hostname, port), None)
+        _upload_connections[(hostname, port)] = connection
 
+    if idle is not None:
+        idle.close()
 
-# ----------------- Start: Add-on UI --------------- #
 
-"""
-    Add-on UI definition
-"""
+def close_upload_connections():
+    with _upload_connections_lock:
+        connections = list(_upload_connections.values())
+        _upload_connections.clear()
 
+    for connection in connections:
+        connection.close()
 
-class ExporterPanel(bpy.types.Panel):
+
+def refresh_upload_connection(url, headers):
     """
-        ExporterPanel class defines the look of the add-on UI
+        Function sends GET request over the idle upload connection to the endpoint, or the new one, and keeps it for
+        the next upload, so it isn't closed by the server keep-alive timeout. Errors are ignored, the upload connects
+        again then
     """
-    bl_idname = "PANEL1_PT_exporter_panel"
-    bl_label = "Export to API"
-    bl_space_type = 'PROPERTIES'
-    bl_region_type = 'WINDOW'
-    bl_context = "object"
-    bl_options = {'DEFAULT_CLOSED'}
 
-    @classmethod
-    def poll(cls, context):
-        return context.object is not None
+    url = urllib_parse.urlsplit(url)
+    connection, _ = get_upload_connection(url.hostname, url.port or 80)
 
-    def draw(self, context):
-        """
-            Function to create add-on UI layout
-        """
+    try:
+        connection.request("GET", (url.path or "/") + ("?" + url.query if url.query else ""), headers=headers)
+        response = connection.getresponse()
+        response.read()
+    except (OSError, http_client.HTTPException):
+        connection.close()
+        return
 
-        # scene properties
-        APIData = context.scene.APIData
-        Request = context.scene.Request
-        LogGroup = context.scene.LogGroup
+    if response.will_close:
+        connection.close()
+    else:
+        release_upload_connection(url.hostname, url.port or 80, connection)
 
-        main_layout = self.layout
-        main_layout.label(text=CREDENTIALS_SECTION_NAME)
 
-        # Credentials section
-        credentials_box = main_layout.box()
-        credentials_box_split = credentials_box.split()
+def zero_copy_supported(url):
+    return url.startswith("http://") and hasattr(os, "sendfile")
 
-        credentials_box_left_column = credentials_box_split.column(align=True)
-        credentials_box_right_column = credentials_box_split.column(align=True)
 
-        credentials_box_left_column.label(text=USERNAME_FIELD)
-        credentials_box_left_column.prop(APIData.user, "username", icon_only=True)
+class UploadFileError(Exception):
+    """
+        UploadFileError exception is raised when the file to upload can't be read. It isn't OSError, so transports
+        and routing don't take it for the failure of the endpoint
+    """
 
-        credentials_box_right_column.label(text=USER_EMAIL_FIELD)
-        credentials_box_right_column.prop(APIData.user, "user_email", icon_only=True)
 
-        credentials_box.row().prop(APIData.user, "authorization")
+@contextlib.contextmanager
+def upload_file_errors():
+    """
+        Context manager raising errors of the local file operations as UploadFileError
+    """
 
-        # server info
-        host_box = main_layout.box()
-        host_box.row().prop(APIData, "host")
-        host_box.row().prop(Request, "endpoint")
-        host_box.split(factor=0.5).operator("system.check_connection")
+    try:
+        yield
+    except OSError as error:
+        raise UploadFileError(error) from error
+
+
+def send_chunk(sock, data):
+    """
+        Function sends data as one chunk of chunked transfer encoding
+    """
+
+    if data:
+        sock.sendall(b"%x\r\n" % len(data))
+        sock.sendall(data)
+        sock.sendall(b"\r\n")
+
+
+def send_file(sock, filepath, digest=None):
+    """
+        Function sends the file as one chunk. Without digest the file is sent by sendfile, otherwise the memory mapped
+        file is hashed and sent chunk by chunk
+    """
+
+    with upload_file_errors():
+        file = open(filepath, 'rb')
+
+    with file:
+        with upload_file_errors():
+            size = os.fstat(file.fileno()).st_size
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size and digest is not None else None
+
+        if size == 0:
+            return
+
+        sock.sendall(b"%x\r\n" % size)
+
+        if mapped is None:
+            sock.sendfile(file, 0, size)
+        else:
+            with mapped, memoryview(mapped) as view:
+                for start in range(0, size, CHUNK_SIZE):
+                    with view[start:start + CHUNK_SIZE] as chunk:
+                        digest.update(chunk)
+                        sock.sendall(chunk)
+
+        sock.sendall(b"\r\n")
+
+
+def stream_upload(url, headers, boundary, fields, files, digests=None):
+    """
+        Function sends POST request with multipart/form-data body over plain HTTP using sendfile. The connection is
+        kept alive for the next upload to the endpoint. Connection errors are raised as requests exceptions, so they
+        are handled the same way as errors of requests, errors of the files are raised as UploadFileError
+
+        headers : dict
+            Request headers, Content-Type has to contain the boundary
+        fields : list
+            (name, value) pairs of form fields
+        files : iterable
+            (name, filename, filepath, content type) tuples of files to send
+        digests : Checksums
+            Filename -> sha256 of the file is filled in and sent in the manifest field after the files, if it's given.
+            Files which already have the checksum aren't hashed again and are sent by sendfile
+    """
+
+    url = urllib_parse.urlsplit(url)
+    connection, connected = get_upload_connection(url.hostname, url.port or 80)
+
+    # connection errors are raised as requests raises them, so routing knows nothing was sent
+    try:
+        if not connected:
+            connection.connect()
+    except socket.timeout as error:
+        raise requests.exceptions.ConnectTimeout(error)
+    except OSError as error:
+        raise requests.exceptions.ConnectionError(urllib3_exceptions.NewConnectionError(connection, str(error)))
+
+    try:
+        connection.putrequest("POST", (url.path or "/") + ("?" + url.query if url.query else ""))
+        for header, value in headers.items():
+            connection.putheader(header, value)
+        connection.putheader("Transfer-Encoding", "chunked")
+        connection.endheaders()
+        sock = connection.sock
+
+        for name, value in fields:
+            send_chunk(sock, multipart_header(boundary, name) + f'{value}\r\n'.encode())
+
+        for name, filename, filepath, content_type in files:
+            send_chunk(sock, multipart_header(boundary, name, filename, content_type))
+
+            digest = digests.sha256() if digests is not None and filename not in digests else None
+            send_file(sock, filepath, digest)
+            if digest is not None:
+                digests[filename] = digest.hexdigest()
+
+            send_chunk(sock, b'\r\n')
+
+        if digests is not None:
+            send_chunk(sock, digests.manifest(boundary))
+
+        send_chunk(sock, f'--{boundary}--\r\n'.encode())
+        sock.sendall(b"0\r\n\r\n")
+
+        response = connection.getresponse()
+        result = TransportResponse(response)
+        if not response.will_close:
+            release_upload_connection(url.hostname, url.port or 80, connection)
+            connection = None
+
+        return result
+    except socket.timeout as error:
+        raise requests.exceptions.Timeout(error)
+    except (OSError, http_client.HTTPException) as error:
+        raise requests.exceptions.ConnectionError(error)
+    finally:
+        if connection is not None:
+            connection.close()
+
+
+# ----------------- End: Upload transport ----------------- #
+
+
+# ----------------- Start: Export helpers ----------------- #
+
+"""
+    Functions to prepare the exported files for the upload. Texture preprocessing is fanned out over a thread pool
+    sized to the machine cores, preprocessed textures are cached by their source hash and preprocessing settings.
+    Results are streamed to the multipart request body as soon as they are ready, so first textures are sent while
+    later ones are still processing.
+"""
+
+# count of textures kept in the preprocessed textures cache
+TEXTURE_CACHE_SIZE = 256
+
+# texture preprocessing pool, created on the first export
+_texture_pool = None
+
+# source file (path, size, mtime) -> source sha256, least recently used first
+_source_hashes = collections.OrderedDict()
+
+# (source sha256, settings) -> preprocessed texture info, least recently used first
+_texture_cache = collections.OrderedDict()
+
+# caches are shared by pipelines, the superseded auto-sync upload can still run
+_texture_cache_lock = threading.Lock()
+
+
+def get_texture_pool():
+    """
+        Function returns the texture preprocessing pool. Threads are used, because the preprocessing only hashes
+        the files and hashlib releases the GIL, forking multi-threaded Blender isn't safe and spawned processes can't
+        import the add-on module without Blender
+    """
+
+    global _texture_pool
+
+    if _texture_pool is None:
+        _texture_pool = concurrent_futures.ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                                              thread_name_prefix="Texture preprocessing")
+
+    return _texture_pool
+
+
+def shutdown_texture_pool():
+    """
+        Function stops the texture preprocessing pool workers
+    """
+
+    global _texture_pool
+
+    if _texture_pool is not None:
+        _texture_pool.shutdown(wait=False)
+        _texture_pool = None
+
+
+def cache_get(cache, key):
+    with _texture_cache_lock:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+
+def cache_put(cache, key, value):
+    """
+        Function stores the value in the cache and removes the least recently used values over TEXTURE_CACHE_SIZE
+    """
+
+    with _texture_cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > TEXTURE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def preprocess_texture(path, settings):
+    """
+        Function preprocesses one texture file in the pool thread. Currently it only computes texture checksum, which
+        transports send in the manifest instead of hashing the texture again, per-file work as resizing, format
+        conversion or metadata stripping has to be added here and write its output to the returned path
+    """
+
+    digest = hashlib.sha256()
+    with upload_file_errors(), open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return {'path': path, 'sha256': digest.hexdigest(), 'size': size}
+
+
+def preprocess_textures(paths):
+    """
+        Generator which preprocesses textures in the pool and yields their info in order of completion.
+        Textures with unchanged source and settings are taken from the cache without being sent to the pool
+    """
+
+    futures = {}
+    for path in paths:
+        with upload_file_errors():
+            stat = os.stat(path)
+        source_key = (path, stat.st_size, stat.st_mtime_ns)
+        source_hash = cache_get(_source_hashes, source_key)
+        texture = cache_get(_texture_cache, (source_hash, TEXTURE_SETTINGS)) if source_hash is not None else None
+
+        if texture is not None:
+            yield dict(texture, filename=os.path.basename(path))
+            continue
+
+        futures[get_texture_pool().submit(preprocess_texture, path, TEXTURE_SETTINGS)] = (path, source_key)
+
+    for future in concurrent_futures.as_completed(futures):
+        path, source_key = futures[future]
+        result = future.result()
+
+        cache_put(_source_hashes, source_key, result['sha256'])
+        cache_put(_texture_cache, (result['sha256'], TEXTURE_SETTINGS), result)
+
+        yield dict(result, filename=os.path.basename(path))
+
+
+def multipart_body(boundary, fields, files, digests=None):
+    """
+        Generator of multipart/form-data request body. Using generator as request data makes requests send the body
+        with chunked transfer encoding, so the parts are sent as soon as they are produced
+
+        fields : list
+            (name, value) pairs of form fields
+        files : iterable
+            (name, filename, filepath, content type) tuples of files to send
+        digests : Checksums
+            Filename -> sha256 of the file is filled in while the file is read and sent in the manifest field after
+            the files, if it's given. Files which already have the checksum aren't hashed again
+    """
+
+    for name, value in fields:
+        yield multipart_header(boundary, name) + f'{value}\r\n'.encode()
+
+    for name, filename, filepath, content_type in files:
+        yield multipart_header(boundary, name, filename, content_type)
+
+        # requests takes OSError raised by the body for connection error, so file errors are raised as UploadFileError
+        digest = digests.sha256() if digests is not None and filename not in digests else None
+        with upload_file_errors(), open(filepath, 'rb') as file:
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                if digest is not None:
+                    digest.update(chunk)
+                yield chunk
+
+        if digest is not None:
+            digests[filename] = digest.hexdigest()
+
+        yield b'\r\n'
+
+    if digests is not None:
+        yield digests.manifest(boundary)
+
+    yield f'--{boundary}--\r\n'.encode()
+
+
+class ExportAborted(Exception):
+    """
+        ExportAborted exception stops the transfer stage when the model export has failed
+    """
+
+
+class ExportPipeline:
+    """
+        ExportPipeline class runs the export stages concurrently with bounded queues between them. Texture discovery,
+        texture preprocessing and transfer run in background threads, while the model is exported by Blender in the
+        main thread. Transfer starts immediately, so textures are sent while the model file is still being written,
+        the model and its assets are sent last. Exported model files are queued without a limit, so Blender never
+        waits for the transfer. When LODs are generated, transfer starts when they are done, so the
+        opened request doesn't wait for them. Transfer is routed between the host replicas, when the endpoint can't be
+        connected, the upload is sent to the next one. Upload isn't repeated after it has reached the endpoint,
+        because the endpoint may have already stored the 3D object.
+
+        timings : dict
+            Stage name -> (start, end) in seconds from the pipeline start
+        messages : list
+            Routing decisions to log, the pipeline can't log them itself from the background thread
+        digests : Checksums
+            Filename -> sha256 of the sent file, computed while it's sent, None if checksums are not needed
+        host : string
+            Host which has answered the upload, it stores the uploaded files
+        failed_lods : list
+            LOD levels which haven't been generated
+    """
+
+    # size of the queues between stages
+    QUEUE_SIZE = 8
+
+    # number of stages which put textures and LODs to the transfer queue
+    PRODUCERS = 1
+
+    def __init__(self, hosts, path, headers, fields, textures_dir, checksums=False, lods=None):
+        self.hosts = hosts
+        self.path = path
+        self.headers = dict(headers)
+        self.fields = fields
+        self.textures_dir = textures_dir
+        self.lods = lods
+
+        self.paths = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.files = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.models = queue.Queue()
+        self.aborted = threading.Event()
+        self.lods_done = threading.Event()
+
+        stages = [("Texture discovery", self._discover),
+                  ("Texture hashing", self._preprocess),
+                  ("Transfer", self._transfer)]
+        if lods is None:
+            self.lods_done.set()
+        else:
+            stages.append(("LOD generation", self._generate_lods))
+
+        self.transferred = []
+        self.transfer_queue = self._transfer_queue()
+
+        self.digests = Checksums() if checksums else None
+
+        self.timings = {}
+        self.messages = []
+        self.response = None
+        self.host = None
+        self.failed_lods = []
+        self.error = None
+
+        self.started = time.perf_counter()
+        self.threads = [threading.Thread(target=self._stage, args=(name, stage), daemon=True)
+                        for name, stage in stages]
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def _stage(self, name, stage):
+        """
+            Function runs one stage and stores its timing and error if there is any
+        """
+
+        start = time.perf_counter() - self.started
+        try:
+            stage()
+        except Exception as error:
+            self.error = self.error or error
+            self.aborted.set()
+        self.timings[name] = (start, time.perf_counter() - self.started)
+
+    def _put(self, items, item):
+        """
+            Function puts item to the stage queue, gives up when the pipeline is aborted
+        """
+
+        while not self.aborted.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _queued(self, items, producers=1):
+        """
+            Generator of items from the stage queue, ends when all stage producers have finished
+        """
+
+        finished = 0
+        while finished < producers:
+            try:
+                item = items.get(timeout=0.1)
+            except queue.Empty:
+                item = False
+
+            if self.aborted.is_set():
+                raise ExportAborted()
+            if item is None:
+                finished += 1
+            elif item:
+                yield item
+
+    def _transfer_queue(self):
+        """
+            Generator of files to transfer, textures and LODs as they are ready, then the exported model files
+        """
+
+        yield from self._queued(self.files, self.PRODUCERS if self.lods is None else self.PRODUCERS + 1)
+        yield from self._queued(self.models)
+
+    def _discover(self):
+        if os.path.exists(self.textures_dir):
+            for f in os.listdir(self.textures_dir):
+                if f.endswith(TEXTURE_EXTENSIONS):
+                    self._put(self.paths, os.path.join(self.textures_dir, f))
+        self._put(self.paths, None)
+
+    def _preprocess(self):
+        for key, texture in enumerate(preprocess_textures(self._queued(self.paths))):
+            # checksum of the texture is already known, so transports don't hash it again while it's sent
+            if self.digests is not None:
+                self.digests[texture['filename']] = texture['sha256']
+            self._put(self.files, (f'textures[{key}]', texture['filename'], texture['path'], 'multipart/form-data'))
+        self._put(self.files, None)
+
+    def _transfer_files(self, sent):
+        """
+            Generator of files for one transfer attempt, files sent by the failed attempts are sent again first.
+            Transports ask for the next file when the previous one is sent, so the time until the generator is resumed
+            is the file transfer time, the time spent waiting for the next file in the queue is not included
+
+            sent : list
+                (size, seconds) of every sent file is appended to it
+        """
+
+        def send(item):
+            start = time.perf_counter()
+            yield item
+            with upload_file_errors():
+                sent.append((os.path.getsize(item[2]), time.perf_counter() - start))
+
+            # aborted pipeline stops sending after the current file, even if no more files are queued
+            if self.aborted.is_set():
+                raise ExportAborted()
+
+        for item in list(self.transferred):
+            yield from send(item)
+
+        for item in self.transfer_queue:
+            self.transferred.append(item)
+            yield from send(item)
+
+    def _generate_lods(self):
+        """
+            Function waits for the LODs and puts them to the transfer queue as model assets
+
+            lods : callable
+                Function waiting for the LODs background processes and returning the generated LODs files and the
+                levels which have failed
+        """
+
+        try:
+            files, self.failed_lods = self.lods()
+        finally:
+            self.lods_done.set()
+
+        for file in files:
+            self._put(self.files, file)
+        self._put(self.files, None)
+
+    def _transfer(self):
+        while not self.lods_done.wait(0.1):
+            if self.aborted.is_set():
+                raise ExportAborted()
+
+        boundary = uuid.uuid4().hex
+        self.headers.update({'Content-Type': "multipart/form-data; boundary=" + boundary})
+
+        def send(host):
+            sent = []
+            self.host = host
+            if zero_copy_supported(host):
+                response = stream_upload(host + self.path, self.headers, boundary, self.fields,
+                                         self._transfer_files(sent), self.digests)
+            else:
+                body = multipart_body(boundary, self.fields, self._transfer_files(sent), self.digests)
+                response = get_session().post(host + self.path, headers=self.headers, data=body, timeout=TIMEOUT)
+
+            if response:
+                endpoint_stats(host).record_throughput(sum(size for size, _ in sent),
+                                                       sum(seconds for _, seconds in sent))
+            return response
+
+        self.response = route_request(self.hosts, send, self.messages.append, measure=False, idempotent=False)
+
+    def export_model(self, export, files):
+        """
+            Function runs the model export in the calling thread and puts exported files to the model queue, which
+            isn't bounded, so it returns without waiting for the transfer. Has to be called from the main thread,
+            because it uses Blender operators
+        """
+
+        start = time.perf_counter() - self.started
+        try:
+            export()
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self.timings["Model export"] = (start, time.perf_counter() - self.started)
+
+        for file in files:
+            self.models.put(file)
+        self.models.put(None)
+
+    def abort(self):
+        self.aborted.set()
+
+    @property
+    def done(self):
+        return not any(thread.is_alive() for thread in self.threads)
+
+    def join(self):
+        """
+            Function waits for all stages and returns the response, errors of the stages are raised here
+        """
+
+        for thread in self.threads:
+            thread.join()
+
+        self.timings["Total"] = (0.0, time.perf_counter() - self.started)
+
+        if self.error is not None and not isinstance(self.error, ExportAborted):
+            raise self.error
+
+        return self.response
+
+
+# count of re-sends of the file which the server has received with a different checksum
+MAX_RESENDS = 2
+
+# fields of every file entry in the export response
+FILE_ENTRY_FIELDS = ('id', 'filename', 'uploadDate', 'href')
+
+
+def valid_upload_response(content):
+    """
+        Function checks the shape of the export response: the model, textures and assets are file entries with
+        string id, filename, upload date and href
+    """
+
+    if not isinstance(content, dict):
+        return False
+
+    entries = [content['model']] if content.get('model') else []
+    for kind in ('textures', 'assets'):
+        if not isinstance(content.get(kind) or [], list):
+            return False
+        entries += content.get(kind) or []
+
+    return all(isinstance(entry, dict) and all(isinstance(entry.get(field), str) for field in FILE_ENTRY_FIELDS)
+               for entry in entries)
+
+
+def upload_entries(content, transferred):
+    """
+        Function pairs the sent files with the files in the server response, the model by its part name, textures and
+        assets by their filenames
+
+        transferred : list
+            (name, filename, filepath, content type) tuples of the sent files
+        returns : list
+            (file entry of the response, sent file) pairs, the entry is None if the server hasn't reported the file
+    """
+
+    entries = {('model', None): content['model']} if content.get('model') else {}
+    for kind in ('textures', 'assets'):
+        for entry in content.get(kind) or []:
+            entries[(kind, entry['filename'])] = entry
+
+    pairs = []
+    for item in transferred:
+        kind = item[0] if item[0] == 'model' else 'textures' if item[0].startswith('textures') else 'assets'
+        pairs.append((entries.get((kind, item[1] if kind != 'model' else None)), item))
+
+    return pairs
+
+
+def resend_file(host, headers, entry, filepath):
+    """
+        Function sends the file again by PUT to its href on the host which has stored it and returns its updated entry.
+        It isn't routed between replicas, as other replicas may not have the file
+    """
+
+    with upload_file_errors():
+        file = open(filepath, 'rb')
+
+    with file:
+        response = get_session().put(host + entry['href'], headers=headers, data=file, timeout=TIMEOUT)
+
+    response.raise_for_status()
+
+    return dict(entry, **response.json())
+
+
+def verify_upload(pipeline, content, log):
+    """
+        Function compares checksums of the files received by the server with checksums computed while they were sent
+        and sends the mismatched files again, up to MAX_RESENDS times. Files missing in the response can't be sent
+        again, as they have no href, they are reported as mismatched
+
+        returns : list
+            Filenames which are missing or still don't match, None if the server doesn't report checksums and all
+            files are in the response
+    """
+
+    headers = dict(pipeline.headers, **{'Content-Type': "application/octet-stream"})
+
+    reported = True
+    missing = []
+    mismatched = []
+    for entry, item in upload_entries(content, pipeline.transferred):
+        if entry is None:
+            log(f"Missing in the response: {item[1]}")
+            missing.append(item[1])
+        elif 'sha256' not in entry:
+            reported = False
+        elif entry['sha256'] != pipeline.digests.get(item[1]):
+            mismatched.append((entry, item))
+
+    if not reported:
+        return missing or None
+
+    for _ in range(MAX_RESENDS):
+        resent = []
+        for entry, item in mismatched:
+            log(f"Checksum mismatch: {item[1]}, sending again")
+            entry = resend_file(pipeline.host, headers, entry, item[2])
+            if entry.get('sha256') != pipeline.digests.get(item[1]):
+                resent.append((entry, item))
+        mismatched = resent
+
+    return missing + [item[1] for _, item in mismatched]
+
+
+# ----------------- End: Export helpers ----------------- #
+
+
+# ----------------- Start: LOD helpers ----------------- #
+
+"""
+    Functions to generate levels of detail (LODs) of the exported scene. Every LOD is exported in a background Blender
+    process from a copy of the project, where Decimate modifier is added to every mesh. LODs are cached in "lods"
+    folder in the project root by the scene meshes hash, so unchanged LODs are not generated again.
+"""
+
+# script run by background Blender processes, imports this add-on module and calls its function
+BACKGROUND_SCRIPT = "import sys; sys.path.insert(0, {path!r}); import {module}; " \
+                    "{module}.{function}(*sys.argv[sys.argv.index('--') + 1:])"
+
+
+def run_in_background(source, function, *args, stdout=None):
+    """
+        Function starts new background Blender process, which loads the project file and calls the function of this
+        add-on module with the given arguments as strings
+    """
+
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    script = BACKGROUND_SCRIPT.format(path=os.path.dirname(os.path.abspath(__file__)), module=module,
+                                      function=function)
+
+    return subprocess.Popen([bpy.app.binary_path, "--background", "--factory-startup", source, "--python-expr", script,
+                             "--"] + [str(arg) for arg in args],
+                            stdout=stdout or subprocess.DEVNULL, universal_newlines=True)
+
+
+def export_scene(file_format, filepath):
+    """
+        Function saves the scene to the file to export using Blender Operators
+    """
+
+    if file_format == 'OBJ':
+        bpy.ops.export_scene.obj(filepath=filepath)
+    elif file_format == 'FBX':
+        bpy.ops.export_scene.fbx(filepath=filepath)
+    elif file_format == 'BLEND':
+        with auto_sync.own_save():
+            bpy.ops.wm.save_mainfile(filepath=filepath)
+    elif file_format == 'GLTF':
+        bpy.ops.export_scene.gltf(filepath=filepath, export_apply=True)
+
+
+def generate_lod(file_format, ratio, filepath):
+    """
+        Function generates one LOD in the background Blender process. Decimate modifier is applied to the mesh data,
+        so every format is exported decimated, .blend file stores only modifiers which are not applied. The file is
+        exported with its final name to a temporary directory, so .mtl written with OBJ is referenced by its final
+        name, and files are moved to the cache when they are complete, the LOD last, so a failed process never leaves
+        a broken LOD in the cache
+    """
+
+    meshes = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+    for obj in meshes:
+        obj.modifiers.new("LOD", 'DECIMATE').ratio = float(ratio)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for obj in meshes:
+        mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        obj.modifiers.clear()
+        obj.data = mesh
+
+    lods_dir, lod_filename = os.path.split(filepath)
+    with tempfile.TemporaryDirectory(dir=lods_dir) as directory:
+        export_scene(file_format, os.path.join(directory, lod_filename))
+
+        for f in sorted(os.listdir(directory), key=lambda f: f == lod_filename):
+            os.replace(os.path.join(directory, f), os.path.join(lods_dir, f))
+
+
+def lod_files(filepath):
+    """
+        Function returns the files of the generated LOD: the LOD and .mtl exported with OBJ, if there is any
+    """
+
+    mtl_filepath = os.path.splitext(filepath)[0] + ".mtl"
+    return [filepath, mtl_filepath] if filepath.endswith(".obj") and os.path.exists(mtl_filepath) else [filepath]
+
+
+def material_data(material):
+    """
+        Function returns the material settings the exported materials depend on: base settings, shader nodes with
+        their input values and images, and node links
+    """
+
+    if material is None:
+        return b""
+
+    values = [material.name, tuple(material.diffuse_color), material.metallic, material.roughness]
+
+    if material.use_nodes and material.node_tree is not None:
+        for node in material.node_tree.nodes:
+            image = getattr(node, "image", None)
+            values.append((node.name, node.bl_idname, image.filepath if image is not None else None))
+
+            for node_input in node.inputs:
+                value = getattr(node_input, "default_value", None)
+                values.append(tuple(value) if hasattr(value, "__len__") and not isinstance(value, str) else value)
+
+        for link in material.node_tree.links:
+            values.append((link.from_node.name, link.from_socket.identifier, link.to_node.name,
+                           link.to_socket.identifier))
+
+    return repr(values).encode()
+
+
+def scene_geometry(context):
+    """
+        Function returns the hash of the evaluated scene meshes and the count of their triangles. The hash includes
+        everything exported with the meshes: geometry, UVs, normals and materials
+    """
+
+    depsgraph = context.evaluated_depsgraph_get()
+    digest = hashlib.sha256()
+    triangles = 0
+
+    for obj in context.scene.objects:
+        if obj.type != 'MESH':
+            continue
+
+        evaluated = obj.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        mesh.calc_loop_triangles()
+
+        # split normals are computed on demand since Blender 4.1
+        if hasattr(mesh, "calc_normals_split"):
+            mesh.calc_normals_split()
+
+        coordinates = array.array('f', [0.0]) * (len(mesh.vertices) * 3)
+        mesh.vertices.foreach_get("co", coordinates)
+        indices = array.array('i', [0]) * (len(mesh.loop_triangles) * 3)
+        mesh.loop_triangles.foreach_get("vertices", indices)
+        normals = array.array('f', [0.0]) * (len(mesh.loops) * 3)
+        mesh.loops.foreach_get("normal", normals)
+        material_indices = array.array('i', [0]) * len(mesh.polygons)
+        mesh.polygons.foreach_get("material_index", material_indices)
+        matrix = array.array('f', [value for row in obj.matrix_world for value in row])
+
+        digest.update(obj.name.encode())
+        digest.update(coordinates.tobytes())
+        digest.update(indices.tobytes())
+        digest.update(normals.tobytes())
+        digest.update(material_indices.tobytes())
+        digest.update(matrix.tobytes())
+
+        for uv_layer in mesh.uv_layers:
+            uvs = array.array('f', [0.0]) * (len(uv_layer.data) * 2)
+            uv_layer.data.foreach_get("uv", uvs)
+            digest.update(uv_layer.name.encode())
+            digest.update(uvs.tobytes())
+
+        for slot in obj.material_slots:
+            digest.update(material_data(slot.material))
+
+        triangles += len(mesh.loop_triangles)
+
+        evaluated.to_mesh_clear()
+
+    return digest.hexdigest(), triangles
+
+
+def lod_ratios(levels, triangles):
+    """
+        Function converts LOD levels string to decimate ratios. Values up to 1 are ratios, greater values are
+        triangle budgets
+    """
+
+    ratios = []
+    for level in levels.split(","):
+        if level.strip() == "":
+            continue
+
+        value = float(level)
+        if value <= 0:
+            raise ValueError(f"LOD level has to be positive: {level.strip()}")
+
+        ratios.append(value if value <= 1 else min(1.0, value / max(triangles, 1)))
+
+    return ratios
+
+
+def start_lods(context, file_format, extension):
+    """
+        Function starts generation of not cached LODs in parallel background Blender processes
+
+        returns : tuple
+            list of (level, filepath, process) tuples, process is None for cached LODs, and the path of the project
+            copy loaded by the processes
+    """
+
+    if context.scene.lod_levels.strip() == "":
+        return [], ""
+
+    geometry_hash, triangles = scene_geometry(context)
+    ratios = lod_ratios(context.scene.lod_levels, triangles)
+    lods_dir = bpy.path.abspath("//" + "lods")
+    source = os.path.join(lods_dir, geometry_hash[:16] + ".blend")
+
+    lods = []
+    processes = {}
+    for level, ratio in enumerate(ratios, 1):
+        filepath = os.path.join(lods_dir, f"{geometry_hash[:16]}_{ratio:.4f}.{extension}")
+
+        if not os.path.exists(filepath) and filepath not in processes:
+            # background processes load the copy of the project saved once for all levels
+            if not os.path.exists(source):
+                os.makedirs(lods_dir, exist_ok=True)
+                with auto_sync.own_save():
+                    bpy.ops.wm.save_as_mainfile(filepath=source, copy=True)
+
+            processes[filepath] = run_in_background(source, "generate_lod", file_format, ratio, filepath)
+
+        lods.append((level, filepath, processes.get(filepath)))
+
+    return lods, source
+
+
+def wait_lods(lods, source):
+    """
+        Function waits for the LODs background processes
+
+        returns : tuple
+            list of the generated LODs (level, filepath) pairs and list of the levels which have failed
+    """
+
+    generated = []
+    failed = []
+    for level, filepath, process in lods:
+        if process is not None:
+            process.wait()
+        if (process is None or process.returncode == 0) and os.path.exists(filepath):
+            generated.append((level, filepath))
+        else:
+            failed.append(level)
+
+    if os.path.exists(source):
+        os.remove(source)
+
+    return generated, failed
+
+
+# ----------------- End: LOD helpers ----------------- #
+
+
+# ----------------- Start: Format profiler ----------------- #
+
+"""
+    Functions to profile the export of the scene in every supported file format. Every format is exported by its own
+    background Blender process, one after another, so the export times don't include the contention of the other
+    exports, then the file size, its compressed size and the upload time are measured. The processes are watched by
+    the timer, so Blender isn't blocked while they run. Upload time is estimated from the latency and throughput of
+    the fastest endpoint measured by previous uploads. Results are cached in "export_profiles.json" in the project
+    root by the scene summary.
+"""
+
+# supported file formats and their files extensions
+FILE_FORMATS = {'OBJ': "obj", 'FBX': "fbx", 'BLEND': "blend", 'GLTF': "glb"}
+
+# upload throughput in bytes per second, assumed when there was no upload to the endpoint yet
+ASSUMED_THROUGHPUT = 10 * 1024 * 1024
+
+# prefix of the line with export time printed by the background process
+PROFILE_PREFIX = "Export profile: "
+
+# seconds between checks of the profiling background process
+PROFILE_INTERVAL = 0.2
+
+
+def modifier_settings(modifier):
+    """
+        Function returns the modifier settings the evaluated geometry depends on: values of all its properties as
+        subdivision levels, decimate ratio and viewport and render visibility, pointers to other data are skipped
+    """
+
+    values = [modifier.name, modifier.type]
+
+    for prop in modifier.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.type in ('POINTER', 'COLLECTION'):
+            continue
+
+        value = getattr(modifier, prop.identifier, None)
+        values.append((prop.identifier, tuple(value) if getattr(prop, "is_array", False) else value))
+
+    return repr(values).encode()
+
+
+def scene_summary(context):
+    """
+        Function returns the fingerprint of the scene profile. Meshes are not evaluated, so it's cheap enough to be
+        computed every time the Export dialog is opened, and it changes with the objects, their modifiers with their
+        settings and the size of their meshes, which the export time and file size depend on
+    """
+
+    digest = hashlib.sha256()
+
+    for obj in context.scene.objects:
+        digest.update(f"{obj.name}:{obj.type}".encode())
+
+        if obj.type == 'MESH':
+            digest.update(f"{len(obj.data.vertices)}:{len(obj.data.polygons)}".encode())
+            for modifier in obj.modifiers:
+                digest.update(modifier_settings(modifier))
+
+    return digest.hexdigest()
+
+
+def profile_export(file_format, filepath):
+    """
+        Function exports the scene in the background Blender process and prints the export time
+    """
+
+    start = time.perf_counter()
+    export_scene(file_format, filepath)
+    print(PROFILE_PREFIX + str(time.perf_counter() - start))
+
+
+def compressed_size(filepath):
+    """
+        Function returns the size of the file compressed by gzip compression
+    """
+
+    compressor = zlib.compressobj()
+    size = 0
+
+    with open(filepath, 'rb') as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            size += len(compressor.compress(chunk))
+
+    return size + len(compressor.flush())
+
+
+def profiles_filepath():
+    return bpy.path.abspath("//" + "export_profiles.json")
+
+
+def load_profile(fingerprint):
+    """
+        Function returns cached profile of the scene with the given fingerprint, None if it was not profiled
+    """
+
+    if not os.path.exists(profiles_filepath()):
+        return None
+
+    with open(profiles_filepath()) as file:
+        return json.load(file).get(fingerprint)
+
+
+def save_profile(fingerprint, profile):
+    profiles = {}
+    if os.path.exists(profiles_filepath()):
+        with open(profiles_filepath()) as file:
+            profiles = json.load(file)
+
+    profiles[fingerprint] = profile
+
+    with open(profiles_filepath(), 'w') as file:
+        json.dump(profiles, file, indent=4)
+
+
+class FormatProfiler:
+    """
+        FormatProfiler class exports the scene in every supported format in background Blender processes one after
+        another and measures them. It's driven by the timer, which checks the running process, so Blender isn't blocked
+
+        profile : dict
+            format -> {export time, size, compressed size}
+        finish : callable
+            Function called with the scene fingerprint and its profile, when all formats are measured
+    """
+
+    def __init__(self, fingerprint, finish):
+        self.fingerprint = fingerprint
+        self.finish = finish
+        self.profile = {}
+        self.formats = list(FILE_FORMATS.items())
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, "source.blend")
+        self.process = None
+        self.output = None
+
+        # timers are identified by the function, a bound method is a new object every time it's accessed
+        self.timer = self.tick
+
+    def start(self):
+        with auto_sync.own_save():
+            bpy.ops.wm.save_as_mainfile(filepath=self.source, copy=True)
+
+        self.run()
+        bpy.app.timers.register(self.timer, first_interval=PROFILE_INTERVAL)
+
+    def filepath(self):
+        return os.path.join(self.directory.name, "profile." + self.formats[0][1])
+
+    def run(self):
+        """
+            Function starts the background process exporting the scene in the next format, its output is written
+            to the file, so the process never waits for the pipe to be read
+        """
+
+        self.output = open(os.path.join(self.directory.name, "profile.log"), 'w+')
+        self.process = run_in_background(self.source, "profile_export", self.formats[0][0], self.filepath(),
+                                         stdout=self.output)
+
+    def measure(self):
+        with self.output:
+            self.output.seek(0)
+            lines = [line for line in self.output.read().splitlines() if line.startswith(PROFILE_PREFIX)]
+
+        filepath = self.filepath()
+        if self.process.returncode != 0 or not lines or not os.path.exists(filepath):
+            return
+
+        self.profile[self.formats[0][0]] = {
+            'export_time': float(lines[-1][len(PROFILE_PREFIX):]),
+            'size': os.path.getsize(filepath),
+            'compressed_size': compressed_size(filepath)
+        }
+
+    def tick(self):
+        """
+            Function measures the finished process and starts the next one, the profile is saved and passed to
+            finish when the last format is measured
+
+            returns : float
+                Seconds to the next tick, None stops the timer
+        """
+
+        global _profiler
+
+        if self.process.poll() is None:
+            return PROFILE_INTERVAL
+
+        # format which can't be measured is left out of the profile, as the failed export
+        try:
+            self.measure()
+        except OSError:
+            pass
+
+        self.formats.pop(0)
+        if self.formats:
+            self.run()
+            return PROFILE_INTERVAL
+
+        _profiler = None
+        self.directory.cleanup()
+        save_profile(self.fingerprint, self.profile)
+        self.finish(self.fingerprint, self.profile)
+
+    def stop(self):
+        if bpy.app.timers.is_registered(self.timer):
+            bpy.app.timers.unregister(self.timer)
+
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+
+        if self.output is not None:
+            self.output.close()
+
+        self.directory.cleanup()
+
+
+# format profiler running in the background, there is at most one
+_profiler = None
+
+
+def profile_formats(context, finish):
+    """
+        Function starts profiling of the scene in every supported format, finish is called with the scene fingerprint
+        and its profile, which is format -> {export time, size, compressed size}, when all formats are measured.
+        Profile cached for the scene is passed to finish immediately
+
+        returns : bool
+            False if the formats are already being profiled
+    """
+
+    global _profiler
+
+    if _profiler is not None:
+        return False
+
+    fingerprint = scene_summary(context)
+
+    profile = load_profile(fingerprint)
+    if profile is not None:
+        finish(fingerprint, profile)
+        return True
+
+    _profiler = FormatProfiler(fingerprint, finish)
+    _profiler.start()
+
+    return True
+
+
+def stop_profiling():
+    global _profiler
+
+    if _profiler is not None:
+        _profiler.stop()
+        _profiler = None
+
+
+@bpy.app.handlers.persistent
+def profiler_load_pre_handler(*args):
+    # profile of the project being closed isn't applied to the loaded one
+    stop_profiling()
+
+
+def upload_times(profile, hosts):
+    """
+        Function estimates the upload time of every profiled format to the fastest endpoint
+    """
+
+    stats = endpoint_stats(rank_endpoints(hosts)[0])
+    return {file_format: stats.upload_time(result['size'], ASSUMED_THROUGHPUT)
+            for file_format, result in profile.items()}
+
+
+def fastest_format(profile, hosts):
+    """
+        Function returns the format with the shortest export and upload time, None for empty profile
+    """
+
+    uploads = upload_times(profile, hosts)
+    return min(profile, key=lambda file_format: profile[file_format]['export_time'] + uploads[file_format],
+               default=None)
+
+
+# ----------------- End: Format profiler ----------------- #
+
+
+# ----------------- Start: Export (VMCK requirements) ----------------- #
+
+"""
+    Implementing the Export of the 3D model in different file formats with textures to VMCK server.
+    To do Export you should have save the project and and store your textures in "textures" folder in the project 
+    root. Supported textures are in png and jpg format. All textures has to be in that folder in the same dir level. No
+    deeper levels are allowed.
+    
+    Checksums of the model, its assets and textures are computed while they are sent and sent in the "manifest" field
+    after them. Checksums reported by the server in the response are compared with them and the mismatched files are
+    sent again
+"""
+
+
+def finish_export(scene, pipeline):
+    """
+        Function waits for the export pipeline, verifies checksums of the uploaded files and logs the response,
+        it's called by Export when the upload is done
+
+        returns : bool
+            True if the server has accepted the upload and received all files unchanged
+    """
+
+    response = None
+    response_content = None
+    mismatched = []
+
+    # waiting for the POST request
+    try:
+        response = pipeline.join()
+        if response:
+            content = response.json()
+            if not valid_upload_response(content):
+                raise ValueError("unexpected shape of the response")
+            response_content = content
+            mismatched = verify_upload(pipeline, response_content, pipeline.messages.append)
+        scene.Response.successful = bool(response) and not mismatched and not pipeline.failed_lods
+    except requests.exceptions.HTTPError as httperr:
+        print(HTTP_ERROR_MESSAGE, httperr)
+        bpy.ops.log.add(log=HTTP_ERROR_MESSAGE + str(httperr))
+    except requests.exceptions.ConnectionError as conerr:
+        print(CONNECTION_ERROR_MESSAGE, conerr)
+        bpy.ops.log.add(log=CONNECTION_ERROR_MESSAGE + str(conerr))
+    except requests.exceptions.Timeout as tmterr:
+        print(TIMEOUT_ERROR_MESSAGE, tmterr)
+        bpy.ops.log.add(log=TIMEOUT_ERROR_MESSAGE + str(tmterr))
+    except ValueError as error:
+        print(INVALID_RESPONSE_MESSAGE, error)
+        bpy.ops.log.add(log=INVALID_RESPONSE_MESSAGE + str(error))
+    except requests.exceptions.RequestException as error:
+        print(UNKNOWN_ERROR_MESSAGE, error)
+        bpy.ops.log.add(log=UNKNOWN_ERROR_MESSAGE + str(error))
+    except UploadFileError as error:
+        print(FILE_ERROR_MESSAGE, error)
+        bpy.ops.log.add(log=FILE_ERROR_MESSAGE + str(error))
+
+    # logging routing decisions and stages timings,
+    # overlapping stages show how much of the upload is hidden behind the export
+    for message in pipeline.messages:
+        bpy.ops.log.add(log=message)
+
+    for stage, (start, end) in pipeline.timings.items():
+        bpy.ops.log.add(log=f"{stage}: {start:.2f} - {end:.2f} s")
+
+    # checksums are computed while the files are sent, their overhead is compared with the transfer time
+    transfer_start, transfer_end = pipeline.timings.get("Transfer", (0.0, 0.0))
+    if pipeline.digests is not None and transfer_end > transfer_start:
+        bpy.ops.log.add(log=f"Checksums: {pipeline.digests.seconds:.2f} s, "
+                            f"{pipeline.digests.seconds / (transfer_end - transfer_start) * 100:.1f} % of transfer")
+
+    # LODs which have failed aren't in the upload, so the export isn't successful
+    if pipeline.failed_lods:
+        bpy.ops.log.add(log="Error: LODs not generated: " + ", ".join(str(level) for level in pipeline.failed_lods))
+
+    if response is None:
+        return False
+
+    # logging the response to Log
+    bpy.ops.log.add(log="Status: " + f"[{str(response.status_code)}]")
+
+    if not response or response_content is None:
+        return False
+
+    if mismatched is None:
+        bpy.ops.log.add(log="Checksums: not reported by the server, upload is not verified")
+    elif mismatched:
+        bpy.ops.log.add(log="Error: files missing or mismatched after sending again: " + ", ".join(mismatched))
+    elif scene.Response.successful:
+        bpy.ops.log.add(log="Checksums: all files verified")
+
+    # info about saved model
+    if response_content.get('model'):
+        bpy.ops.log.add(log="< ---- Model ---- >")
+        bpy.ops.log.add(log="ID: " + response_content['model']['id'])
+        bpy.ops.log.add(log="Filename: " + response_content['model']['filename'])
+        bpy.ops.log.add(log="Upload date: " + response_content['model']['uploadDate'])
+        bpy.ops.log.add(log="Href: " + response_content['model']['href'])
+
+    # info about model textures
+    bpy.ops.log.add(log="< ---- Textures ---- >")
+    for texture in response_content.get('textures') or []:
+        bpy.ops.log.add(log="ID: " + texture['id'])
+        bpy.ops.log.add(log="Filename: " + texture['filename'])
+        bpy.ops.log.add(log="Upload date: " + texture['uploadDate'])
+        bpy.ops.log.add(log="Href: " + texture['href'])
+        bpy.ops.log.add(log="------------------------")
+
+    bpy.ops.log.add(log="Done!")
+
+    return scene.Response.successful
+
+
+class Export(bpy.types.Operator):
+    """
+        Export class exports 3D models in different formats with their textures to the VMCK server
+    """
+
+    bl_idname = "system.export"
+    bl_label = "Export"
+
+    # set by auto-sync, the operator returns when the model is exported and the upload runs in the background
+    background: bpy.props.BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
+
+    # invokes the dialog with the user to choose the file format, the fastest format is pre-selected if the scene
+    # was profiled, unless the user has chosen another format
+    def invoke(self, context, event):
+        scene = context.scene
+        if not scene.is_property_set("file_format") or scene.file_format == scene.preselected_format:
+            profile = load_profile(scene_summary(context))
+            if profile:
+                scene.file_format = scene.preselected_format = fastest_format(profile, api_hosts(scene.APIData))
+
+        return context.window_manager.invoke_props_dialog(self, width=300)
+
+    # file format dialog
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(context.scene, "file_format")
+        layout.prop(context.scene, "lod_levels")
+
+    def execute(self, context):
+
+        register_operators()
+
+        # checking the file name
+        if bpy.context.scene.filename is "":
+            bpy.ops.log.add(log=FILENAME_EMPTY_MESSAGE)
+            return {'FINISHED'}
+
+        # checking the connection with the server by its cached state, which is refreshed in the background,
+        # if all endpoints are known to be down stops export without waiting for any request
+        monitor_endpoints(context)
+        if connection_state(api_hosts(context.scene.APIData)) is False:
+            bpy.ops.log.add(log=SERVER_UNAVAILABLE_MESSAGE)
+            return {'FINISHED'}
+
+        # getting the project dir path
+        dir = bpy.path.abspath("//")
+
+        # preparing the 3D model file info
+        file_format = context.scene.file_format + ".glb" \
+            if context.scene.file_format == "GLTF" else context.scene.file_format
+
+        # filename from the filename field
+        filename = context.scene.filename
+
+        # creating the filepath to save file to export
+        filepath = bpy.path.abspath("//" + filename + "." + file_format.lower())
+
+        # textures are discovered in the textures folder in the project root by the pipeline
+        textures_dir = bpy.path.abspath("//" + "textures")
+
+        # setting up request variables
+        hosts = api_hosts(context.scene.APIData)
+        path = context.scene.Request.endpoint
+        headers = {'Authorization': "Bearer " + context.scene.APIData.user.authorization}
+
+        # model to export, it's sent after textures, when Blender has finished writing it
+        files = [('model', filename, filepath, 'multipart/form-data')]
+
+        if file_format == 'OBJ':
+            mtl_file_obj_filepath = dir + filename + ".mtl"
+            files.append(('assets', filename + ".mtl", mtl_file_obj_filepath, 'multipart/form-data'))
+
+        # LODs are generated in background processes while the model is exported
+        try:
+            lods, lods_source = start_lods(context, context.scene.file_format, file_format.lower())
+        except ValueError as error:
+            bpy.ops.log.add(log="Error: " + str(error))
+            return {'FINISHED'}
+
+        # saving the file to export
+        def export_model():
+            export_scene(context.scene.file_format, filepath)
+
+        # LODs are sent as model assets, the pipeline waits for them in the background
+        # .mtl of OBJ LOD is sent with the name the LOD references it by
+        def generated_lods():
+            files = []
+            generated, failed = wait_lods(lods, lods_source)
+            for level, lod_filepath in generated:
+                lod_filepath, *assets = lod_files(lod_filepath)
+                files.append(('assets', f"{filename}_lod{level}.{file_format.lower()}", lod_filepath,
+                              'multipart/form-data'))
+                files += [('assets', os.path.basename(asset), asset, 'multipart/form-data') for asset in assets]
+            return files, failed
+
+        bpy.ops.log.add(log="Exporting..." + filename)
+
+        context.scene.Response.successful = False
+
+        # manual export of the scene with auto-sync is recorded, so auto-sync doesn't upload the same version again,
+        # and it supersedes the background upload of the previous version
+        fingerprint = None
+        if context.scene.auto_sync and not self.background:
+            fingerprint = sync_fingerprint(context)
+            auto_sync.supersede()
+
+        # textures discovery, preprocessing and upload start before the model export
+        pipeline = ExportPipeline(hosts, path, headers, [('name', filename)], textures_dir, checksums=True,
+                                  lods=generated_lods if lods else None)
+        pipeline.start()
+
+        try:
+            pipeline.export_model(export_model, files)
+        except RuntimeError as error:
+            bpy.ops.log.add(log="Error: model export failed: " + str(error))
+            return {'FINISHED'}
+
+        bpy.ops.log.add(log="Tmp file saved to: " + dir)
+
+        # background export is finished by auto-sync when the upload is done, so Blender isn't blocked by the upload
+        if self.background:
+            scene = context.scene
+            auto_sync.watch(pipeline, lambda: finish_export(scene, pipeline))
+            return {'FINISHED'}
+
+        if finish_export(context.scene, pipeline) and fingerprint is not None:
+            auto_sync.synced = fingerprint
+
+        return {'FINISHED'}
+
+
+class ProfileFormats(bpy.types.Operator):
+    """
+        ProfileFormats class exports the scene in every supported format in background processes and logs the export
+        time, file size and upload time of each of them, then pre-selects the fastest format, using Blender Operator
+    """
+
+    bl_idname = "system.profile_formats"
+    bl_label = "Profile formats"
+
+    def execute(self, context):
+        register_operators()
+
+        scene = context.scene
+
+        # called by the profiler timer when all formats are measured
+        def finish(fingerprint, profile):
+            hosts = api_hosts(scene.APIData)
+            uploads = upload_times(profile, hosts)
+
+            for file_format, result in profile.items():
+                bpy.ops.log.add(log=f"{file_format}: export {result['export_time']:.2f} s, "
+                                    f"size {result['size'] / 1024 / 1024:.2f} MB "
+                                    f"({result['compressed_size'] / 1024 / 1024:.2f} MB compressed), "
+                                    f"upload {uploads[file_format]:.2f} s")
+
+            file_format = fastest_format(profile, hosts)
+            if file_format is None:
+                bpy.ops.log.add(log="Error: export of the scene failed in every format")
+                return
+
+            scene.file_format = scene.preselected_format = file_format
+            bpy.ops.log.add(log="Fastest format: " + file_format)
+
+        bpy.ops.log.add(log="Profiling export formats...")
+        if not profile_formats(context, finish):
+            bpy.ops.log.add(log="Export formats are already being profiled")
+
+        return {'FINISHED'}
+
+
+# ----------------- Start: Export (VMCK requirements) ----------------- #
+
+
+# ----------------- Start: Auto-sync ----------------- #
+
+"""
+    Auto-sync exports the project to the server in the background after it's saved. The export is scheduled after
+    the quiet period, which is restarted by every save and every change of the scene, so bursts of saves are uploaded
+    once. Saves which don't change the exported meshes, materials, textures or export settings are skipped. The model
+    is exported by Blender in the timer, but the upload runs in the background, when a newer version is exported while
+    the previous one is still being uploaded, the previous upload is aborted.
+"""
+
+# seconds between checks of the quiet period and of the background upload
+AUTO_SYNC_INTERVAL = 0.5
+
+
+def sync_fingerprint(context):
+    """
+        Function returns the hash of everything the export depends on: the scene meshes with their materials, textures
+        and export settings
+    """
+
+    scene = context.scene
+    digest = hashlib.sha256(scene_geometry(context)[0].encode())
+    digest.update(json.dumps([scene.file_format, scene.filename, scene.lod_levels,
+                              api_hosts(scene.APIData), scene.Request.endpoint]).encode())
+
+    textures_dir = bpy.path.abspath("//" + "textures")
+    if os.path.exists(textures_dir):
+        for f in sorted(os.listdir(textures_dir)):
+            if f.endswith(TEXTURE_EXTENSIONS):
+                stat = os.stat(os.path.join(textures_dir, f))
+                digest.update(f"{f}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    return digest.hexdigest()
+
+
+class AutoSync:
+    """
+        AutoSync class schedules exports after saves and watches their background uploads. It's driven by the save
+        and depsgraph handlers and by one timer, which runs while an export is scheduled or uploaded
+
+        synced : string
+            Fingerprint of the last version accepted by the server
+        upload : tuple
+            (pipeline, finish, fingerprint) of the background upload, finish logs the response and returns True
+            if the server has accepted it
+    """
+
+    def __init__(self):
+        self.pending = False
+        self.last_activity = 0.0
+        self.fingerprint = None
+        self.synced = None
+        self.upload = None
+        self.own_saves = 0
+
+    def saved(self):
+        # saves of the add-on itself (BLEND export, copies for LODs and profiling) aren't user's saves
+        if self.own_saves or not bpy.context.scene.auto_sync:
+            return
+
+        self.pending = True
+        self.last_activity = time.monotonic()
+        self.schedule()
+
+    def changed(self):
+        if self.pending:
+            self.last_activity = time.monotonic()
+
+    def schedule(self):
+        if not bpy.app.timers.is_registered(auto_sync_timer):
+            bpy.app.timers.register(auto_sync_timer, first_interval=AUTO_SYNC_INTERVAL)
+
+    def tick(self):
+        """
+            Function finishes the upload when it's done and starts the export when the quiet period has passed
+
+            returns : float
+                Seconds to the next tick, None stops the timer
+        """
+
+        if self.upload is not None and self.upload[0].done:
+            _, finish, fingerprint = self.upload
+            self.upload = None
+            if finish():
+                self.synced = fingerprint
+
+        if self.pending:
+            remaining = self.last_activity + bpy.context.scene.auto_sync_delay - time.monotonic()
+            if remaining > 0:
+                return min(remaining, AUTO_SYNC_INTERVAL)
+
+            self.pending = False
+            self.sync(bpy.context)
+
+        return AUTO_SYNC_INTERVAL if self.pending or self.upload is not None else None
+
+    def sync(self, context):
+        register_operators()
+
+        fingerprint = sync_fingerprint(context)
+        if fingerprint in (self.synced, self.upload and self.upload[2]):
+            bpy.ops.log.add(log="Auto-sync: no changes to export")
+            return
+
+        bpy.ops.log.add(log="Auto-sync: exporting changes...")
+        self.fingerprint = fingerprint
+        bpy.ops.system.export(background=True)
+
+    @contextlib.contextmanager
+    def own_save(self):
+        """
+            Context manager for saves made by the add-on, they don't schedule the export
+        """
+
+        self.own_saves += 1
+        try:
+            yield
+        finally:
+            self.own_saves -= 1
+
+    def supersede(self):
+        """
+            Function aborts the background upload of the previous version, a newer version is exported
+        """
+
+        if self.upload is not None:
+            self.upload[0].abort()
+            self.upload = None
+            bpy.ops.log.add(log="Auto-sync: previous upload superseded")
+
+    def watch(self, pipeline, finish):
+        """
+            Function is called by Export started in the background
+        """
+
+        self.supersede()
+        self.upload = (pipeline, finish, self.fingerprint)
+        self.schedule()
+
+    def stop(self):
+        self.pending = False
+
+        if self.upload is not None:
+            self.upload[0].abort()
+            self.upload = None
+
+        if bpy.app.timers.is_registered(auto_sync_timer):
+            bpy.app.timers.unregister(auto_sync_timer)
+
+    def reset(self):
+        """
+            Function is called before another project is loaded, the export and the upload of the current project are
+            stopped, as their scene is removed, and versions of the current project are forgotten
+        """
+
+        self.stop()
+        self.fingerprint = None
+        self.synced = None
+
+
+auto_sync = AutoSync()
+
+
+def auto_sync_timer():
+    return auto_sync.tick()
+
+
+@bpy.app.handlers.persistent
+def auto_sync_save_handler(*args):
+    auto_sync.saved()
+
+
+@bpy.app.handlers.persistent
+def auto_sync_depsgraph_handler(*args):
+    auto_sync.changed()
+
+
+def enable_auto_sync(enabled):
+    """
+        Function adds the save and depsgraph handlers while auto-sync is on and removes them when it's off, so the
+        add-on isn't called on every change of the scene when auto-sync isn't used
+    """
+
+    for handlers, handler in ((bpy.app.handlers.save_post, auto_sync_save_handler),
+                              (bpy.app.handlers.depsgraph_update_post, auto_sync_depsgraph_handler)):
+        if enabled and handler not in handlers:
+            handlers.append(handler)
+        elif not enabled and handler in handlers:
+            handlers.remove(handler)
+
+    if not enabled:
+        auto_sync.pending = False
+
+
+def update_auto_sync():
+    enable_auto_sync(any(scene.auto_sync for scene in bpy.data.scenes))
+
+
+def auto_sync_update(self, context):
+    update_auto_sync()
+
+
+@bpy.app.handlers.persistent
+def auto_sync_load_pre_handler(*args):
+    auto_sync.reset()
+
+
+@bpy.app.handlers.persistent
+def auto_sync_load_handler(*args):
+    update_auto_sync()
+
+
+# ----------------- End: Auto-sync ----------------- #
+
+
+# ----------------- Start: Add-on UI --------------- #
+
+"""
+    Add-on UI definition
+"""
+
+
+class ExporterPanel(bpy.types.Panel):
+    """
+        ExporterPanel class defines the look of the add-on UI
+    """
+    bl_idname = "PANEL1_PT_exporter_panel"
+    bl_label = "Export to API"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "object"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None
+
+    def draw(self, context):
+        """
+            Function to create add-on UI layout
+        """
+
+        # scene properties
+        APIData = context.scene.APIData
+        Request = context.scene.Request
+        LogGroup = context.scene.LogGroup
+
+        main_layout = self.layout
+        main_layout.label(text=CREDENTIALS_SECTION_NAME)
+
+        # Credentials section
+        credentials_box = main_layout.box()
+        credentials_box_split = credentials_box.split()
+
+        credentials_box_left_column = credentials_box_split.column(align=True)
+        credentials_box_right_column = credentials_box_split.column(align=True)
+
+        credentials_box_left_column.label(text=USERNAME_FIELD)
+        credentials_box_left_column.prop(APIData.user, "username", icon_only=True)
+
+        credentials_box_right_column.label(text=USER_EMAIL_FIELD)
+        credentials_box_right_column.prop(APIData.user, "user_email", icon_only=True)
+
+        credentials_box.row().prop(APIData.user, "authorization")
+
+        # server info
+        host_box = main_layout.box()
+        host_box.row().prop(APIData, "host")
+        host_box.row().prop(APIData, "replicas")
+        host_box.row().prop(Request, "endpoint")
+        host_box.split(factor=0.5).operator("system.check_connection")
 
         # TODO ------ Import section#
         main_layout.label(text=IMPORT_SECTION_NAME)
@@ -833,6 +2902,10 @@ class ExporterPanel(bpy.types.Panel):
         export_filename_row.prop(context.scene, "filename")
         export_buttons_row = export_box.row()
         export_buttons_row.operator("system.export")
+        export_buttons_row.operator("system.profile_formats")
+        export_sync_row = export_box.row()
+        export_sync_row.prop(context.scene, "auto_sync")
+        export_sync_row.prop(context.scene, "auto_sync_delay")
 
         # Log section
         log_box = main_layout.box()
@@ -854,20 +2927,41 @@ classes = (
     Log,
     LogGroup,
     LogList,
-    AddLog,
     ClearLogList,
     Request,
     Response,
     CheckConnection,
+    Export,
+    ProfileFormats,
+    ExporterPanel
+)
+
+# operators used only by other operators, registered on the first use of the add-on
+operator_classes = (
+    AddLog,
     DoRequest,
     DoGetRequest,
     DoPostRequest,
     DoPutRequest,
-    DoDeleteRequest,
-    Export,
-    ExporterPanel
+    DoDeleteRequest
 )
 
+_operators_registered = False
+
+
+def register_operators():
+    """
+        Function registers operators used only by other operators. It's called by the panel operators, scripts
+        which call these operators directly have to call it first
+    """
+
+    global _operators_registered
+
+    if not _operators_registered:
+        for cls in operator_classes:
+            bpy.utils.register_class(cls)
+        _operators_registered = True
+
 
 def register():
     for cls in classes:
@@ -886,19 +2980,77 @@ def register():
             ('GLTF', "GLTF", 'glTF file')
         ]
     )
+    bpy.types.Scene.preselected_format = bpy.props.StringProperty(
+        name="Pre-selected format",
+        description="File format pre-selected by the profile, the file format is not pre-selected if it differs",
+        options={'HIDDEN'}
+    )
     bpy.types.Scene.LogGroup = bpy.props.PointerProperty(type=LogGroup)
     bpy.types.Scene.filename = bpy.props.StringProperty(
         name="Filename",
         description="Filename of file to export",
         default=""
     )
+    bpy.types.Scene.lod_levels = bpy.props.StringProperty(
+        name="LODs",
+        description="Comma separated LODs to export with the model, as decimate ratios (0-1) or triangle budgets",
+        default=""
+    )
+    bpy.types.Scene.auto_sync = bpy.props.BoolProperty(
+        name="Auto-sync",
+        description="Export the project in the background after it's saved",
+        default=False,
+        update=auto_sync_update
+    )
+    bpy.types.Scene.auto_sync_delay = bpy.props.FloatProperty(
+        name="Delay",
+        description="Seconds without saves and changes before the project is exported",
+        default=5.0,
+        min=0.5,
+        unit='TIME_ABSOLUTE'
+    )
+
+    # auto-sync handlers follow the setting of the loaded project, bpy.data isn't available during registration,
+    # so the project open when the add-on is enabled is checked by the timer
+    bpy.app.handlers.load_pre.append(auto_sync_load_pre_handler)
+    bpy.app.handlers.load_pre.append(profiler_load_pre_handler)
+    bpy.app.handlers.load_post.append(auto_sync_load_handler)
+    bpy.app.timers.register(update_auto_sync, first_interval=0.0)
 
 
 def unregister():
+    global _operators_registered
+
+    if auto_sync_load_pre_handler in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(auto_sync_load_pre_handler)
+    if profiler_load_pre_handler in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(profiler_load_pre_handler)
+    if auto_sync_load_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(auto_sync_load_handler)
+    if bpy.app.timers.is_registered(update_auto_sync):
+        bpy.app.timers.unregister(update_auto_sync)
+
+    enable_auto_sync(False)
+    auto_sync.stop()
+    stop_profiling()
+    shutdown_texture_pool()
+    health_monitor.stop()
+    close_session()
+    close_upload_connections()
+
+    if _operators_registered:
+        for cls in reversed(operator_classes):
+            bpy.utils.unregister_class(cls)
+        _operators_registered = False
+
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
+    del bpy.types.Scene.auto_sync_delay
+    del bpy.types.Scene.auto_sync
+    del bpy.types.Scene.lod_levels
     del bpy.types.Scene.LogGroup
+    del bpy.types.Scene.preselected_format
     del bpy.types.Scene.Response
     del bpy.types.Scene.Request
     del bpy.types.Scene.APIData
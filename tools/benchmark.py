@@ -0,0 +1,200 @@
+"""
+Benchmark of Export to API add-on. It measures the add-on startup time, the time of its import and registration in
+a new background Blender process, compared with the import of requests it defers. Then it uploads the same set of
+generated model and texture files to a local sink server with every upload path and reports the client CPU time per GB
+and the throughput. For the path with checksums it also reports the share of the upload time spent hashing:
+
+    files     - requests.post(files=...) with open files, the original upload path
+    stream    - requests.post(data=multipart_body(...)), streamed body used for HTTPS
+    sendfile  - stream_upload() over plain HTTP, files are sent by sendfile
+    mmap+hash - stream_upload() with checksums, files are memory mapped, hashed and sent in one pass
+
+The add-on module imports bpy, so the benchmark has to be run by Blender:
+
+    blender --background --factory-startup --python tools/benchmark.py -- --size 1024 --textures 8 --startup-runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, ROOT)
+
+import bpy
+import requests
+import exporter_to_api
+
+# size of chunks used by the sink server
+CHUNK_SIZE = 1024 * 1024
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    """
+        SinkHandler class reads and discards the request body and answers with 201, so the benchmark measures
+        the client only
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                while size > 0:
+                    size -= len(self.rfile.read(min(CHUNK_SIZE, size)))
+                self.rfile.readline()
+        else:
+            remaining = int(self.headers.get("Content-Length", 0))
+            while remaining > 0:
+                remaining -= len(self.rfile.read(min(CHUNK_SIZE, remaining)))
+
+        self.send_response(201)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+
+# scripts run by new Blender processes to measure the startup time
+STARTUP_SCRIPTS = (
+    ("add-on", "import sys; sys.path.insert(0, {root!r}); import time; start = time.perf_counter(); "
+               "import exporter_to_api; exporter_to_api.register(); "
+               "print('STARTUP', time.perf_counter() - start, 'requests' in sys.modules)"),
+    ("requests", "import sys, time; start = time.perf_counter(); import requests; "
+                 "print('STARTUP', time.perf_counter() - start, 'requests' in sys.modules)")
+)
+
+
+def benchmark_startup(runs):
+    """
+        Function measures the import of the add-on with its registration and the import of requests, every run in new
+        Blender process, so no module is imported before
+    """
+
+    print(f"{'startup':<12}{'median ms':>10}{'max ms':>10}{'requests':>10}")
+    for name, script in STARTUP_SCRIPTS:
+        times = []
+        for _ in range(runs):
+            output = subprocess.run([bpy.app.binary_path, "--background", "--factory-startup",
+                                     "--python-expr", script.format(root=ROOT)],
+                                    stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+            line = next(line for line in output.splitlines() if line.startswith("STARTUP"))
+            _, duration, imported = line.split()
+            times.append(float(duration) * 1000)
+
+        print(f"{name:<12}{statistics.median(times):>10.1f}{max(times):>10.1f}{imported:>10}")
+
+
+def upload_files(url, files):
+    opened = {name: (filename, open(filepath, 'rb'), content_type) for name, filename, filepath, content_type in files}
+    try:
+        return requests.post(url, files=opened, timeout=exporter_to_api.TIMEOUT)
+    finally:
+        for _, file, _ in opened.values():
+            file.close()
+
+
+def upload_stream(url, files):
+    headers = {'Content-Type': "multipart/form-data; boundary=benchmark"}
+    body = exporter_to_api.multipart_body("benchmark", [('name', "benchmark")], iter(files))
+    return requests.post(url, headers=headers, data=body, timeout=exporter_to_api.TIMEOUT)
+
+
+def upload_sendfile(url, files, digests=None):
+    headers = {'Content-Type': "multipart/form-data; boundary=benchmark"}
+    return exporter_to_api.stream_upload(url, headers, "benchmark", [('name', "benchmark")], iter(files), digests)
+
+
+def upload_mmap(url, files):
+    checksums = exporter_to_api.Checksums()
+    response = upload_sendfile(url, files, checksums)
+    response.hashing = checksums.seconds
+    return response
+
+
+UPLOADS = (
+    ("files", upload_files),
+    ("stream", upload_stream),
+    ("sendfile", upload_sendfile),
+    ("mmap+hash", upload_mmap)
+)
+
+
+def generate_files(directory, size, textures):
+    """
+        Function writes the model and textures of the given total size in MB
+    """
+
+    part_size = size * 1024 * 1024 // (textures + 1)
+    files = []
+
+    for key in range(textures + 1):
+        name, filename = ('model', "model.obj") if key == 0 else (f'textures[{key - 1}]', f"texture_{key - 1}.png")
+        filepath = os.path.join(directory, filename)
+
+        with open(filepath, 'wb') as file:
+            for start in range(0, part_size, CHUNK_SIZE):
+                file.write(os.urandom(min(CHUNK_SIZE, part_size - start)))
+
+        files.append((name, filename, filepath, 'multipart/form-data'))
+
+    return files
+
+
+def benchmark_uploads(size, textures, repeat):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SinkHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/3DObjects"
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = generate_files(directory, size, textures)
+        total = sum(os.path.getsize(filepath) for _, _, filepath, _ in files)
+        gigabytes = total / 1024 ** 3
+
+        print(f"{'upload':<12}{'CPU s/GB':>10}{'MB/s':>10}{'hash %':>10}")
+        for name, upload in UPLOADS:
+            cpu = wall = hashing = 0.0
+            for _ in range(repeat):
+                # uploads run in the calling thread, thread CPU time doesn't include the sink server
+                cpu_start, wall_start = time.thread_time(), time.perf_counter()
+                response = upload(url, files)
+                cpu += time.thread_time() - cpu_start
+                wall += time.perf_counter() - wall_start
+                hashing += getattr(response, "hashing", 0.0)
+                assert response.status_code == 201
+
+            print(f"{name:<12}{cpu / repeat / gigabytes:>10.3f}{total * repeat / wall / 1024 ** 2:>10.1f}"
+                  f"{hashing / wall * 100:>10.1f}")
+
+    server.shutdown()
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Benchmark of Export to API add-on upload paths")
+    parser.add_argument("--size", type=int, default=512, help="total size of uploaded files in MB")
+    parser.add_argument("--textures", type=int, default=8, help="count of textures")
+    parser.add_argument("--repeat", type=int, default=3, help="count of uploads of every path")
+    parser.add_argument("--startup-runs", type=int, default=5, help="count of Blender processes measuring startup")
+    args = parser.parse_args(argv)
+
+    benchmark_startup(args.startup_runs)
+    benchmark_uploads(args.size, args.textures, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
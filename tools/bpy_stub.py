@@ -0,0 +1,56 @@
+"""
+Minimal stand-in of Blender bpy module, which lets the tools import Export to API add-on outside Blender and run its
+networking code: export pipeline, upload transport, routing between replicas and checksums verification. Blender
+operators, properties, UI and data are not available, the add-on classes are defined but never registered.
+
+Usage:
+    import bpy_stub
+    bpy_stub.install()
+    import exporter_to_api
+"""
+
+import sys
+import types
+
+
+class Types(types.ModuleType):
+    """
+        Types class returns a new base class for every bpy.types name, so the add-on classes can be defined
+    """
+
+    def __getattr__(self, name):
+        base = type(name, (), {})
+        setattr(self, name, base)
+        return base
+
+
+class Props(types.ModuleType):
+    """
+        Props class returns a property definition function for every bpy.props name
+    """
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def install():
+    """
+        Function installs the stand-in as bpy module, unless it runs in Blender
+    """
+
+    if "bpy" in sys.modules:
+        return
+
+    try:
+        import bpy
+        return
+    except ImportError:
+        pass
+
+    bpy = types.ModuleType("bpy")
+    bpy.types = Types("bpy.types")
+    bpy.props = Props("bpy.props")
+    bpy.app = types.SimpleNamespace(binary_path="blender",
+                                    handlers=types.SimpleNamespace(persistent=lambda function: function))
+
+    sys.modules.update({"bpy": bpy, "bpy.types": bpy.types, "bpy.props": bpy.props})
@@ -0,0 +1,198 @@
+"""
+Load generator for the VMCK server or its local stand-in (tools/vmck_server.py). It simulates artists working with
+Export to API add-on at the same time, every artist is a process, as every artist runs own Blender. Artists run
+the add-on's own code paths outside Blender (see tools/bpy_stub.py): the export pipeline (streamed upload of the
+model, .mtl asset and textures with sendfile over HTTP, routing between replicas, manifest of checksums and re-sends
+of mismatched files) and the requests of system.do_request operators (GET, POST, PUT and DELETE over the shared
+keep-alive session with routing) in a loop. At the end it reports p50/p95/p99 latency and throughput of every request
+type.
+
+Usage:
+    python tools/vmck_server.py --quiet &
+    python tools/load_generator.py --host http://127.0.0.1:8000 --artists 16 --duration 30
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import bpy_stub
+
+bpy_stub.install()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+import exporter_to_api
+
+
+class Results:
+    """
+        Results class collects latencies, errors and sent bytes of every request type from all artists
+    """
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self.sent = {}
+
+    def add(self, kind, latency, size=0, failed=False):
+        if failed:
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+        else:
+            self.latencies.setdefault(kind, []).append(latency)
+            self.sent[kind] = self.sent.get(kind, 0) + size
+
+    def report(self, duration):
+        print(f"{'request':<10}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+              f"{'req/s':>10}{'MB/s':>10}")
+
+        for kind in sorted(set(self.latencies) | set(self.errors)):
+            latencies = sorted(self.latencies.get(kind, []))
+            percentiles = [percentile(latencies, p) * 1000 for p in (50, 95, 99)]
+            print(f"{kind:<10}{len(latencies):>8}{self.errors.get(kind, 0):>8}"
+                  f"{percentiles[0]:>10.1f}{percentiles[1]:>10.1f}{percentiles[2]:>10.1f}"
+                  f"{len(latencies) / duration:>10.2f}{self.sent.get(kind, 0) / duration / 1024 / 1024:>10.2f}")
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[p - 1]
+
+
+class Artist:
+    """
+        Artist class runs export and request code paths of the add-on in the loop until the deadline
+    """
+
+    def __init__(self, hosts, endpoint, token, files, textures_dir, export_share, deadline):
+        self.hosts = hosts
+        self.endpoint = endpoint
+        self.headers = {'Authorization': "Bearer " + token}
+        self.files = files
+        self.textures_dir = textures_dir
+        self.export_share = export_share
+        self.deadline = deadline
+        self.results = []
+        self.record_id = ""
+        self.export_size = sum(os.path.getsize(filepath) for _, _, filepath, _ in files)
+        self.export_size += sum(entry.stat().st_size for entry in os.scandir(textures_dir))
+
+    def run(self):
+        while time.perf_counter() < self.deadline:
+            if random.random() < self.export_share:
+                self.timed("EXPORT", self.export, self.export_size)
+            else:
+                for method in ("GET", "POST", "PUT", "DELETE"):
+                    self.timed(method, lambda: self.request(method))
+
+        return self.results
+
+    def timed(self, kind, call, size=0):
+        start = time.perf_counter()
+        try:
+            failed = not call()
+        except (requests.exceptions.RequestException, ValueError):
+            failed = True
+        self.results.append((kind, time.perf_counter() - start, size, failed))
+
+    def export(self):
+        """
+            Function runs the export pipeline as Export operator does, the model is already exported
+        """
+
+        pipeline = exporter_to_api.ExportPipeline(self.hosts, self.endpoint, self.headers, [('name', "load_test")],
+                                                  self.textures_dir, checksums=True)
+        pipeline.start()
+        pipeline.export_model(lambda: None, self.files)
+
+        response = pipeline.join()
+        return response and exporter_to_api.verify_upload(pipeline, response.json(), lambda message: None) == []
+
+    def request(self, method):
+        payload = {"name": "load_test", "value": random.random()}
+        path = self.endpoint if method in ("GET", "POST") else "/records/" + self.record_id
+
+        def send(host):
+            return exporter_to_api.get_session().request(method, host + path, headers=self.headers,
+                                                         data=payload if method in ("POST", "PUT") else None,
+                                                         timeout=exporter_to_api.TIMEOUT)
+
+        response = exporter_to_api.route_request(self.hosts, send, lambda message: None,
+                                                 idempotent=method != "POST")
+        if method == "POST":
+            self.record_id = response.json().get("id", "") if response.status_code == 201 else ""
+        return response
+
+
+def run_artist(arguments):
+    return Artist(*arguments).run()
+
+
+def generate_files(directory, model_size, textures, texture_size):
+    """
+        Function writes the model, its .mtl asset and textures in the project layout the add-on exports from
+    """
+
+    megabyte = 1024 * 1024
+    textures_dir = os.path.join(directory, "textures")
+    os.makedirs(textures_dir)
+
+    files = []
+    for name, filename, size in (('model', "load_test", model_size), ('assets', "load_test.mtl", 0)):
+        filepath = os.path.join(directory, filename)
+        with open(filepath, 'wb') as file:
+            file.write(os.urandom(int(size * megabyte)) if size else b"newmtl material\n")
+        files.append((name, filename, filepath, 'multipart/form-data'))
+
+    for key in range(textures):
+        with open(os.path.join(textures_dir, f"texture_{key}.png"), 'wb') as file:
+            file.write(os.urandom(int(texture_size * megabyte)))
+
+    return files, textures_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator simulating artists using Export to API add-on")
+    parser.add_argument("--host", default="http://127.0.0.1:8000", help="host and comma separated replicas")
+    parser.add_argument("--endpoint", default="/3DObjects")
+    parser.add_argument("--token", default="")
+    parser.add_argument("--artists", type=int, default=8, help="count of concurrent artists")
+    parser.add_argument("--duration", type=float, default=10.0, help="test duration in seconds")
+    parser.add_argument("--export-share", type=float, default=0.5, help="share of exports among artists actions")
+    parser.add_argument("--model-size", type=float, default=5.0, help="model size in MB")
+    parser.add_argument("--textures", type=int, default=4, help="count of textures")
+    parser.add_argument("--texture-size", type=float, default=2.0, help="texture size in MB")
+    args = parser.parse_args()
+
+    hosts = [host.strip() for host in args.host.split(",") if host.strip()]
+
+    with tempfile.TemporaryDirectory() as directory:
+        files, textures_dir = generate_files(directory, args.model_size, args.textures, args.texture_size)
+
+        start = time.perf_counter()
+        artists = [(hosts, args.endpoint, args.token, files, textures_dir, args.export_share, start + args.duration)
+                   for _ in range(args.artists)]
+
+        with multiprocessing.Pool(args.artists) as pool:
+            artists_results = pool.map(run_artist, artists)
+
+        duration = time.perf_counter() - start
+
+    results = Results()
+    for artist_results in artists_results:
+        for result in artist_results:
+            results.add(*result)
+
+    results.report(duration)
+
+
+if __name__ == "__main__":
+    main()
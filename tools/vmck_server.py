@@ -0,0 +1,363 @@
+"""
+Local stand-in of the VMCK server for testing Export to API add-on without the real server. It implements the
+endpoints the add-on uses: multipart upload of 3D model with its textures and assets, which answers with 201 and the
+same JSON as VMCK API, and simple CRUD of records for system.do_request operators. Every uploaded file entry has
+sha256 of the received content, files can be re-sent by PUT to their href. Latency, bandwidth, failures and
+corruption of received files can be configured to test the add-on under bad network conditions.
+
+Usage:
+    python tools/vmck_server.py --port 8000 --latency 0.05 --bandwidth 10 --failure-rate 0.1 --corrupt-rate 0.05
+"""
+
+import argparse
+import datetime
+import email
+import email.policy
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from urllib.parse import parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# size of chunks used when reading and writing bodies
+CHUNK_SIZE = 64 * 1024
+
+# collections of uploaded files
+FILE_COLLECTIONS = ("models", "textures", "assets")
+
+
+class Storage:
+    """
+        Storage class keeps uploaded objects, files and records in memory
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.objects = {}
+        self.files = {collection: {} for collection in FILE_COLLECTIONS}
+        self.records = {}
+
+    def add_file(self, collection, filename, content):
+        file_id = uuid.uuid4().hex[:24]
+        info = {
+            "id": file_id,
+            "filename": filename,
+            "uploadDate": now(),
+            "href": f"/{collection}/{file_id}",
+            "sha256": hashlib.sha256(content).hexdigest()
+        }
+
+        with self.lock:
+            self.files[collection][file_id] = (info, content)
+
+        return info
+
+
+def now():
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def parse_multipart(content_type, body):
+    """
+        Function parses multipart/form-data body to the list of (name, filename, content) tuples,
+        filename is None for simple fields
+    """
+
+    boundary = content_type.split("boundary=")[1].split(";")[0].strip('"').encode()
+    parts = []
+
+    for segment in body.split(b"--" + boundary)[1:-1]:
+        headers, _, content = segment[2:-2].partition(b"\r\n\r\n")
+        disposition = email.message_from_bytes(headers + b"\r\n\r\n", policy=email.policy.HTTP)
+        parts.append((disposition.get_param("name", header="content-disposition"), disposition.get_filename(),
+                      content))
+
+    return parts
+
+
+class ClientDropped(Exception):
+    """
+        ClientDropped exception is raised when the client closes the connection in the middle of the request body,
+        as aborted and superseded uploads of the add-on do
+    """
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+        Handler class handles requests of the add-on, server configuration is in the server attributes
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def throttle(self, size):
+        if self.server.bandwidth:
+            time.sleep(size / self.server.bandwidth)
+
+    def read_body(self):
+        """
+            Function reads the request body, with Content-Length or chunked transfer encoding used by the add-on.
+            Body cut off by the closed connection or with malformed chunk size raises ClientDropped
+        """
+
+        chunks = []
+
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                try:
+                    size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                except ValueError:
+                    raise ClientDropped()
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunk = self.rfile.read(size)
+                if len(chunk) < size:
+                    raise ClientDropped()
+                chunks.append(chunk)
+                self.rfile.readline()
+                self.throttle(size)
+        else:
+            remaining = int(self.headers.get("Content-Length", 0))
+            while remaining > 0:
+                chunk = self.rfile.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise ClientDropped()
+                chunks.append(chunk)
+                remaining -= len(chunk)
+                self.throttle(len(chunk))
+
+        return b"".join(chunks)
+
+    def respond(self, status, content=None, content_type="application/json"):
+        if isinstance(content, (dict, list)):
+            content = json.dumps(content).encode()
+
+        content = content or b""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+
+        for start in range(0, len(content), CHUNK_SIZE):
+            self.wfile.write(content[start:start + CHUNK_SIZE])
+            self.throttle(min(CHUNK_SIZE, len(content) - start))
+
+    def handle_one_request(self):
+        """
+            Function injects configured latency and failures before handling the request
+        """
+
+        time.sleep(self.server.latency)
+
+        if random.random() < self.server.drop_rate:
+            self.close_connection = True
+            self.connection.close()
+            return
+
+        try:
+            super().handle_one_request()
+        except (ClientDropped, ConnectionError):
+            # the client has gone in the middle of the request, there is nobody to answer
+            self.close_connection = True
+
+    def received(self, content):
+        """
+            Function flips one byte of the received file content with the configured probability
+        """
+
+        if content and random.random() < self.server.corrupt_rate:
+            position = random.randrange(len(content))
+            content = content[:position] + bytes([content[position] ^ 0xFF]) + content[position + 1:]
+        return content
+
+    def failed(self):
+        if random.random() < self.server.failure_rate:
+            self.read_body()
+            self.respond(503, {"error": "Service unavailable"})
+            return True
+        return False
+
+    def split_path(self):
+        return [part for part in self.path.split("?")[0].split("/") if part]
+
+    def do_GET(self):
+        if self.failed():
+            return
+
+        path = self.split_path()
+        storage = self.server.storage
+
+        if len(path) == 2 and path[0] in FILE_COLLECTIONS and path[1] in storage.files[path[0]]:
+            self.respond(200, storage.files[path[0]][path[1]][1], "application/octet-stream")
+        elif len(path) == 2 and path[0] == "3DObjects" and path[1] in storage.objects:
+            self.respond(200, storage.objects[path[1]])
+        elif len(path) == 2 and path[1] in storage.records:
+            self.respond(200, storage.records[path[1]])
+        else:
+            self.respond(200, {"status": "ok", "time": now()})
+
+    def do_POST(self):
+        if self.failed():
+            return
+
+        content_type = self.headers.get("Content-Type", "")
+        body = self.read_body()
+
+        if content_type.startswith("multipart/form-data"):
+            self.respond(201, self.upload(parse_multipart(content_type, body)))
+        else:
+            self.respond(201, self.create_record(body))
+
+    def do_PUT(self):
+        if self.failed():
+            return
+
+        path = self.split_path()
+        body = self.read_body()
+        storage = self.server.storage
+
+        if len(path) == 2 and path[0] in FILE_COLLECTIONS and path[1] in storage.files[path[0]]:
+            info, _ = storage.files[path[0]][path[1]]
+            body = self.received(body)
+            info = dict(info, uploadDate=now(), sha256=hashlib.sha256(body).hexdigest())
+            with storage.lock:
+                storage.files[path[0]][path[1]] = (info, body)
+            self.respond(200, info)
+        elif len(path) == 2 and path[1] in storage.records:
+            storage.records[path[1]].update(self.form(body))
+            self.respond(200, storage.records[path[1]])
+        else:
+            self.respond(404, {"error": "Not found"})
+
+    def do_DELETE(self):
+        if self.failed():
+            return
+
+        path = self.split_path()
+        storage = self.server.storage
+
+        with storage.lock:
+            deleted = len(path) == 2 and (storage.records.pop(path[1], None) or storage.objects.pop(path[1], None))
+
+        self.respond(200 if deleted else 404, {"deleted": bool(deleted)})
+
+    def form(self, body):
+        """
+            Function parses request data sent by system.do_post_request and system.do_put_request as form fields
+        """
+
+        try:
+            return json.loads(body)
+        except ValueError:
+            return dict(parse_qsl(body.decode(errors="replace")))
+
+    def create_record(self, body):
+        record_id = uuid.uuid4().hex[:24]
+        record = dict(self.form(body), id=record_id, createdDate=now())
+
+        with self.server.storage.lock:
+            self.server.storage.records[record_id] = record
+
+        return record
+
+    def upload(self, parts):
+        """
+            Function stores uploaded 3D object and returns it in the same format as VMCK API
+        """
+
+        storage = self.server.storage
+        object_id = str(uuid.uuid4())
+        name = ""
+        model = None
+        textures = []
+        assets = []
+
+        for field, filename, content in parts:
+            if filename is not None:
+                content = self.received(content)
+
+            if filename is None:
+                if field == "name":
+                    name = content.decode()
+            elif field == "model":
+                model = storage.add_file("models", filename, content)
+            elif field.startswith("textures"):
+                textures.append(storage.add_file("textures", filename, content))
+            else:
+                assets.append(storage.add_file("assets", filename, content))
+
+        content = {
+            "id": object_id,
+            "structureId": object_id,
+            "name": name,
+            "transformation": [
+                [1, 0, 0],
+                [0, 1, 0],
+                [0, 0, 1]
+            ],
+            "createdDate": now(),
+            "model": model,
+            "textures": textures,
+            "properties": [],
+            "status": "preparing",
+            "assets": assets,
+            "version": "1.0.0",
+            "href": f"/3DObjects/{object_id}/1.0.0"
+        }
+
+        with storage.lock:
+            storage.objects[object_id] = content
+
+        return content
+
+
+def create_server(host="127.0.0.1", port=8000, latency=0.0, bandwidth=0.0, failure_rate=0.0, drop_rate=0.0,
+                  quiet=False, corrupt_rate=0.0):
+    """
+        Function creates the server, bandwidth is in bytes per second, 0 means unlimited
+    """
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.storage = Storage()
+    server.latency = latency
+    server.bandwidth = bandwidth
+    server.failure_rate = failure_rate
+    server.drop_rate = drop_rate
+    server.corrupt_rate = corrupt_rate
+    server.quiet = quiet
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in of the VMCK server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="delay of every request in seconds")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="bandwidth in MB/s, 0 means unlimited")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of connections closed without answer")
+    parser.add_argument("--corrupt-rate", type=float, default=0.0, help="share of received files with a flipped byte")
+    parser.add_argument("--quiet", action="store_true", help="don't log requests")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.latency, args.bandwidth * 1024 * 1024, args.failure_rate,
+                           args.drop_rate, args.quiet, args.corrupt_rate)
+    print(f"VMCK stand-in server listening on http://{args.host}:{server.server_port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()